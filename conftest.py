@@ -0,0 +1,73 @@
+"""Shared pytest fixtures for the BST Visualizer tests."""
+import os
+import pickle
+import random
+
+import pytest
+
+from src.models import BinarySearchTree
+
+
+@pytest.fixture
+def random_values():
+    """
+    Factory for reproducible lists of distinct random node values.
+    
+    Returns:
+        Function taking n and returning n distinct values, seeded by n
+    """
+    def make(n: int):
+        return random.Random(n).sample(range(n * 10), n)
+    return make
+
+
+def _build_classic_bst() -> BinarySearchTree:
+    """Build the complete seven-node tree the fixtures below hand out."""
+    bst = BinarySearchTree()
+    for val in (50, 30, 70, 20, 40, 60, 80):
+        bst.insert(val)
+    return bst
+
+
+@pytest.fixture(scope="module")
+def classic_bst():
+    """
+    Complete seven-node tree shared by the read-only tests.
+    Module scoped, so each pytest-xdist worker builds its own. Tests
+    that modify the tree must request fresh_bst instead.
+    
+    Returns:
+        BinarySearchTree built from 50, 30, 70, 20, 40, 60, 80
+    """
+    return _build_classic_bst()
+
+
+@pytest.fixture(scope="session")
+def _classic_bst_pickle():
+    """Pickled copy of the seven-node tree, built once per session."""
+    return pickle.dumps(_build_classic_bst())
+
+
+@pytest.fixture
+def fresh_bst(_classic_bst_pickle):
+    """
+    Private copy of the seven-node tree for tests that modify it.
+    Unpickling relinks the nodes without any value comparisons.
+    
+    Returns:
+        BinarySearchTree equal to classic_bst
+    """
+    return pickle.loads(_classic_bst_pickle)
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """
+    QApplication for widget tests, rendering offscreen; skips without PyQt5.
+    
+    Returns:
+        The running QApplication
+    """
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    QtWidgets = pytest.importorskip("PyQt5.QtWidgets")
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
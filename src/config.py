@@ -1,4 +1,5 @@
 """Configuration and constants for BST Visualizer."""
+import sys
 
 # Window configuration
 WINDOW_WIDTH = 1600
@@ -35,6 +36,11 @@ ANIMATION_DURATION = 500  # milliseconds
 ANIMATION_STEPS = 20
 HIGHLIGHT_DURATION = 800  # milliseconds
 TRAVERSAL_STEP_DELAY = 400  # milliseconds
+RESIZE_REDRAW_DELAY = 40  # milliseconds, coalesces drag-resize redraws
+MESSAGE_THROTTLE_INTERVAL = 16  # milliseconds, ~60 status text updates per second
+# Above this many nodes the canvas repaints the whole viewport per frame
+# instead of tracking a dirty region for every changed item
+FULL_VIEWPORT_UPDATE_MIN_NODES = 50
 
 # Spacing
 VERTICAL_GAP = 120
@@ -57,6 +63,13 @@ COLORS_LIGHT = {
     "border": "#bdc3c7",
     "text": "#2c3e50",
     "background": "#ffffff",
+    "input_background": "#ffffff",
+    "primary_pressed": "#2471a3",
+    "danger_hover": "#c0392b",
+    "success_hover": "#27ae60",
+    "disabled": "#bdc3c7",
+    "disabled_text": "#95a5a6",
+    "slider_groove": "#ecf0f1",
 }
 
 # Colors - Dark Theme
@@ -70,8 +83,22 @@ COLORS_DARK = {
     "border": "#444444",
     "text": "#ecf0f1",
     "background": "#2b2b2b",
+    "input_background": "#1a1a1a",
+    "primary_pressed": "#1f618d",
+    "danger_hover": "#a93226",
+    "success_hover": "#28a745",
+    "disabled": "#555555",
+    "disabled_text": "#888888",
+    "slider_groove": "#444444",
 }
 
+# Traversal types sent from the control panel to the main window. Interned,
+# so comparing against them is an identity check in the common case
+TRAVERSAL_INORDER = sys.intern("inorder")
+TRAVERSAL_PREORDER = sys.intern("preorder")
+TRAVERSAL_POSTORDER = sys.intern("postorder")
+TRAVERSAL_LEVELORDER = sys.intern("level-order")
+
 # Traversal colors
 TRAVERSAL_COLORS = {
     "inorder": "#9b59b6",
@@ -1,9 +1,5 @@
 """Main entry point for BST Visualizer application."""
 import sys
-from PyQt5.QtWidgets import QApplication
-from PyQt5.QtCore import Qt
-
-from src.ui.main_window import MainWindow
 
 
 def main():
@@ -11,6 +7,14 @@ def main():
     Main entry point for the application.
     Creates and displays the main window.
     """
+    # Import Qt here so importing the package stays cheap
+    from PyQt5.QtWidgets import QApplication
+    from PyQt5.QtCore import Qt
+    from src.ui.main_window import MainWindow
+    
+    # Share GL contexts between views; must be set before QApplication exists
+    QApplication.setAttribute(Qt.AA_ShareOpenGLContexts)
+    
     # Create Qt application
     app = QApplication(sys.argv)
     
@@ -1,7 +1,8 @@
 """Binary Search Tree implementation."""
-from typing import Optional, List
-from collections import deque
+from typing import Optional, List, Iterator
 from .node import Node
+from .cache import cached_per_version
+from src.config import HORIZONTAL_GAP, VERTICAL_GAP
 
 
 class BinarySearchTree:
@@ -15,17 +16,41 @@ class BinarySearchTree:
     Properties:
     - Maintains BST property: left.value < parent.value < right.value
     - Automatically updates node positions for visualization
+    - Keeps every node's height up to date, so the tree height is O(1)
+    - Optionally rebalances itself with AVL rotations (self_balancing=True)
     """
     
-    def __init__(self):
-        """Initialize an empty BST."""
+    def __init__(self, self_balancing: bool = False):
+        """
+        Initialize an empty BST.
+        
+        Args:
+            self_balancing: Rebalance with AVL rotations after every insert and
+                delete, keeping all operations O(log N). Off by default so the
+                visualizer shows plain BST behaviour.
+        """
         self.root = None
+        self.self_balancing = self_balancing
         self._size = 0
-        self._height_cache = -1
+        # Total AVL rotations performed, for tests and benchmarks
+        self._rotation_count = 0
+        # Bumped on every structural change; cached queries key on it
+        self._version = 0
+        self._layout_version = -1
+    
+    def _mutated(self):
+        """Invalidate every cached query after a structural change."""
+        self._version += 1
+    
+    @property
+    def version(self) -> int:
+        """Counter that changes with every insert, delete and clear."""
+        return self._version
     
     def insert(self, value: int) -> bool:
         """
         Insert a value into the BST.
+        Walks down from the root to the empty child slot where the value belongs.
         
         Args:
             value: Integer value to insert
@@ -36,72 +61,103 @@ class BinarySearchTree:
         if self.root is None:
             self.root = Node(value)
             self._size = 1
-            self._height_cache = -1
+            self._mutated()
             return True
         
-        return self._insert_recursive(self.root, value)
+        node = self.root
+        while True:
+            if value < node.value:
+                if node.left is None:
+                    node.left = Node(value, parent=node)
+                    break
+                node = node.left
+            elif value > node.value:
+                if node.right is None:
+                    node.right = Node(value, parent=node)
+                    break
+                node = node.right
+            else:
+                # Value already exists
+                return False
+        
+        self._retrace(node)
+        self._size += 1
+        self._mutated()
+        return True
     
-    def _insert_recursive(self, node: Node, value: int) -> bool:
+    def extend(self, values) -> int:
         """
-        Recursively insert a value into the BST.
+        Insert many values in one call.
+        Same result as calling insert() for each value in order, but the
+        descent loop works on local variables only, which matters when
+        filling a tree from a list.
         
         Args:
-            node: Current node in the recursion
-            value: Value to insert
+            values: Iterable of integer values (duplicates are skipped)
             
         Returns:
-            True if insertion was successful, False if value already exists
+            Number of values actually inserted
         """
-        if value < node.value:
-            if node.left is None:
-                node.left = Node(value, parent=node)
-                self._size += 1
-                self._height_cache = -1
-                return True
-            return self._insert_recursive(node.left, value)
-        elif value > node.value:
-            if node.right is None:
-                node.right = Node(value, parent=node)
-                self._size += 1
-                self._height_cache = -1
-                return True
-            return self._insert_recursive(node.right, value)
-        else:
-            # Value already exists
-            return False
-    
-    def search(self, value: int) -> Optional[Node]:
-        """
-        Search for a node with the given value.
+        root = self.root
+        retrace = self._retrace
+        inserted = 0
         
-        Args:
-            value: Value to search for
+        for value in values:
+            if root is None:
+                root = self.root = Node(value)
+                inserted += 1
+                continue
             
-        Returns:
-            Node if found, None otherwise
-        """
-        return self._search_recursive(self.root, value)
+            node = root
+            while True:
+                node_value = node.value
+                if value < node_value:
+                    child = node.left
+                    if child is None:
+                        node.left = Node(value, parent=node)
+                        break
+                elif value > node_value:
+                    child = node.right
+                    if child is None:
+                        node.right = Node(value, parent=node)
+                        break
+                else:
+                    node = None
+                    break
+                node = child
+            
+            if node is not None:
+                retrace(node)
+                # Rotations may have moved the root
+                root = self.root
+                inserted += 1
+        
+        if inserted:
+            self._size += inserted
+            self._mutated()
+        return inserted
     
-    def _search_recursive(self, node: Optional[Node], value: int) -> Optional[Node]:
+    def search(self, value: int) -> Optional[Node]:
         """
-        Recursively search for a value in the BST.
+        Search for a node with the given value.
         
         Args:
-            node: Current node in the recursion
             value: Value to search for
             
         Returns:
             Node if found, None otherwise
         """
-        if node is None:
-            return None
-        
-        if value == node.value:
-            return node
-        elif value < node.value:
-            return self._search_recursive(node.left, value)
-        else:
-            return self._search_recursive(node.right, value)
+        node = self.root
+        # Equality is the rare outcome, so test it last
+        while node is not None:
+            node_value = node.value
+            if value < node_value:
+                node = node.left
+            elif value > node_value:
+                node = node.right
+            else:
+                return node
+        return None
     
     def delete(self, value: int) -> bool:
         """
@@ -117,80 +173,158 @@ class BinarySearchTree:
         Returns:
             True if deletion was successful, False if value not found
         """
-        if self.root is None:
+        node = self.search(value)
+        if node is None:
             return False
         
-        self.root, deleted = self._delete_recursive(self.root, value)
-        if deleted:
-            self._size -= 1
-            self._height_cache = -1
-        return deleted
+        if node.left is not None and node.right is not None:
+            # Two children: find the in-order successor (leftmost node of the
+            # right subtree) and detach it in the same descent, then move its
+            # value into the node being deleted
+            successor_parent = node
+            successor = node.right
+            while successor.left is not None:
+                successor_parent = successor
+                successor = successor.left
+            
+            if successor_parent is node:
+                successor_parent.right = successor.right
+            else:
+                successor_parent.left = successor.right
+            if successor.right is not None:
+                successor.right.parent = successor_parent
+            
+            node.value = successor.value
+            self._retrace(successor_parent)
+        else:
+            # Leaf or one child: the child (if any) takes the node's place
+            self._replace_in_parent(node, node.left if node.left is not None else node.right)
+            self._retrace(node.parent)
+        
+        self._size -= 1
+        self._mutated()
+        return True
     
-    def _delete_recursive(self, node: Optional[Node], value: int) -> tuple:
+    def _replace_in_parent(self, node: Node, child: Optional[Node]):
         """
-        Recursively delete a value from the BST.
+        Replace a node with its (possibly empty) child in the parent's link.
         
         Args:
-            node: Current node in the recursion
-            value: Value to delete
-            
-        Returns:
-            Tuple of (updated_node, was_deleted)
+            node: Node being removed from the tree
+            child: Node taking its place, or None
         """
-        if node is None:
-            return None, False
+        parent = node.parent
+        if child is not None:
+            child.parent = parent
         
-        if value < node.value:
-            node.left, deleted = self._delete_recursive(node.left, value)
-            if node.left:
-                node.left.parent = node
-            return node, deleted
-        elif value > node.value:
-            node.right, deleted = self._delete_recursive(node.right, value)
-            if node.right:
-                node.right.parent = node
-            return node, deleted
+        if parent is None:
+            self.root = child
+        elif parent.left is node:
+            parent.left = child
         else:
-            # Found the node to delete
+            parent.right = child
+    
+    @staticmethod
+    def _height(node: Optional[Node]) -> int:
+        """Return the stored height of a subtree (-1 for an empty one)."""
+        return node.height if node is not None else -1
+    
+    def _update_height(self, node: Node):
+        """Recompute a node's height from its children's stored heights."""
+        node.height = 1 + max(self._height(node.left), self._height(node.right))
+    
+    def _retrace(self, node: Optional[Node]):
+        """
+        Walk up the parent chain after a structural change, updating stored
+        heights and rebalancing when self-balancing is enabled.
+        Stops as soon as a subtree's height is unchanged, since nothing above
+        it can be affected.
+        
+        Args:
+            node: Lowest node whose subtree changed
+        """
+        while node is not None:
+            old_height = node.height
+            self._update_height(node)
             
-            # Case 1: Leaf node
-            if node.is_leaf():
-                return None, True
+            if self.self_balancing:
+                balance = self._height(node.left) - self._height(node.right)
+                if balance > 1 or balance < -1:
+                    node = self._rebalance(node, balance)
             
-            # Case 2: Only right child
-            if node.left is None:
-                node.right.parent = node.parent
-                return node.right, True
+            if node.height == old_height:
+                break
+            node = node.parent
+    
+    def _rebalance(self, node: Node, balance: int) -> Node:
+        """
+        Restore the AVL property at a node using single or double rotations.
+        
+        Args:
+            node: Node whose subtrees differ in height by 2
+            balance: Height of left subtree minus height of right subtree
             
-            # Case 3: Only left child
-            if node.right is None:
-                node.left.parent = node.parent
-                return node.left, True
+        Returns:
+            New root of the rebalanced subtree
+        """
+        if balance > 1:
+            # Left-Right case: straighten the left child first
+            if self._height(node.left.left) < self._height(node.left.right):
+                self._rotate_left(node.left)
+            return self._rotate_right(node)
+        
+        # Right-Left case: straighten the right child first
+        if self._height(node.right.right) < self._height(node.right.left):
+            self._rotate_right(node.right)
+        return self._rotate_left(node)
+    
+    def _rotate_left(self, node: Node) -> Node:
+        """
+        Rotate a subtree left, lifting the right child into the node's place.
+        
+        Args:
+            node: Root of the subtree to rotate
             
-            # Case 4: Two children - find in-order successor
-            # In-order successor is the leftmost node in the right subtree
-            successor = self._find_min_node(node.right)
-            node.value = successor.value
-            node.right, _ = self._delete_recursive(node.right, successor.value)
-            if node.right:
-                node.right.parent = node
-            return node, True
+        Returns:
+            New root of the subtree
+        """
+        self._rotation_count += 1
+        pivot = node.right
+        node.right = pivot.left
+        if pivot.left is not None:
+            pivot.left.parent = node
+        
+        self._replace_in_parent(node, pivot)
+        pivot.left = node
+        node.parent = pivot
+        
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
     
-    def _find_min_node(self, node: Optional[Node]) -> Optional[Node]:
+    def _rotate_right(self, node: Node) -> Node:
         """
-        Find the node with minimum value in a subtree.
+        Rotate a subtree right, lifting the left child into the node's place.
         
         Args:
-            node: Root of the subtree
+            node: Root of the subtree to rotate
             
         Returns:
-            Node with minimum value
+            New root of the subtree
         """
-        if node is None:
-            return None
-        while node.left:
-            node = node.left
-        return node
+        self._rotation_count += 1
+        pivot = node.left
+        node.left = pivot.right
+        if pivot.right is not None:
+            pivot.right.parent = node
+        
+        self._replace_in_parent(node, pivot)
+        pivot.right = node
+        node.parent = pivot
+        
+        self._update_height(node)
+        self._update_height(pivot)
+        return pivot
     
     def inorder_traversal(self) -> List[int]:
         """
@@ -200,17 +334,38 @@ class BinarySearchTree:
         Returns:
             List of values in in-order sequence
         """
-        result = []
-        self._inorder_recursive(self.root, result)
+        # Morris traversal: instead of a stack, temporarily thread each
+        # in-order predecessor's empty right link back to its successor,
+        # and remove the thread on the second visit. Uses O(1) extra memory
+        # and leaves the tree unchanged when done.
+        result = [0] * self._size
+        index = 0
+        node = self.root
+        
+        while node:
+            if node.left is None:
+                result[index] = node.value
+                index += 1
+                node = node.right
+                continue
+            
+            predecessor = node.left
+            while predecessor.right is not None and predecessor.right is not node:
+                predecessor = predecessor.right
+            
+            if predecessor.right is None:
+                # First visit: thread and descend left
+                predecessor.right = node
+                node = node.left
+            else:
+                # Left subtree done: unthread, visit and move right
+                predecessor.right = None
+                result[index] = node.value
+                index += 1
+                node = node.right
+        
         return result
     
-    def _inorder_recursive(self, node: Optional[Node], result: List[int]):
-        """Recursive helper for in-order traversal."""
-        if node:
-            self._inorder_recursive(node.left, result)
-            result.append(node.value)
-            self._inorder_recursive(node.right, result)
-    
     def preorder_traversal(self) -> List[int]:
         """
         Perform pre-order traversal (Root, Left, Right).
@@ -219,16 +374,58 @@ class BinarySearchTree:
         Returns:
             List of values in pre-order sequence
         """
-        result = []
-        self._preorder_recursive(self.root, result)
+        result = [0] * self._size
+        self.preorder_iter_into(result)
         return result
     
-    def _preorder_recursive(self, node: Optional[Node], result: List[int]):
-        """Recursive helper for pre-order traversal."""
-        if node:
-            result.append(node.value)
-            self._preorder_recursive(node.left, result)
-            self._preorder_recursive(node.right, result)
+    def preorder_iter_into(self, out: List[int], node: Optional[Node] = None) -> int:
+        """
+        Write the pre-order values into a preallocated list.
+        
+        Args:
+            out: List with room for every value written
+            node: Root of the subtree to walk (the whole tree by default)
+            
+        Returns:
+            Number of values written
+        """
+        if node is None:
+            node = self.root
+        index = 0
+        stack = [node] if node else []
+        
+        while stack:
+            node = stack.pop()
+            out[index] = node.value
+            index += 1
+            
+            # Push right first so the left subtree is visited first
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+        
+        return index
+    
+    def get_subtree_preorder(self, value: int) -> List[int]:
+        """
+        Pre-order values of the subtree rooted at the node holding value.
+        Inserting them in this order rebuilds the subtree with the same shape.
+        
+        Args:
+            value: Value of the subtree's root
+            
+        Returns:
+            List of values in pre-order sequence, empty if value is not found
+        """
+        node = self.search(value)
+        if node is None:
+            return []
+        
+        # A subtree of height h holds at most 2^(h+1) - 1 nodes
+        result = [0] * min(self._size, (1 << (node.height + 1)) - 1)
+        del result[self.preorder_iter_into(result, node):]
+        return result
     
     def postorder_traversal(self) -> List[int]:
         """
@@ -238,17 +435,27 @@ class BinarySearchTree:
         Returns:
             List of values in post-order sequence
         """
-        result = []
-        self._postorder_recursive(self.root, result)
+        if not self.root:
+            return []
+        
+        # A (Root, Right, Left) walk is exactly the reverse of post-order,
+        # so fill the result from the back
+        result = [0] * self._size
+        index = self._size
+        stack = [self.root]
+        
+        while stack:
+            node = stack.pop()
+            index -= 1
+            result[index] = node.value
+            
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        
         return result
     
-    def _postorder_recursive(self, node: Optional[Node], result: List[int]):
-        """Recursive helper for post-order traversal."""
-        if node:
-            self._postorder_recursive(node.left, result)
-            self._postorder_recursive(node.right, result)
-            result.append(node.value)
-    
     def levelorder_traversal(self) -> List[int]:
         """
         Perform level-order traversal (BFS).
@@ -260,20 +467,114 @@ class BinarySearchTree:
         if not self.root:
             return []
         
-        result = []
-        queue = deque([self.root])
+        # BFS over a preallocated buffer: a tree never queues more than
+        # size nodes, so head/tail indexes replace a deque
+        size = self._size
+        queue = [None] * size
+        queue[0] = self.root
+        head, tail = 0, 1
+        result = [0] * size
         
-        while queue:
-            node = queue.popleft()
-            result.append(node.value)
+        while head < tail:
+            node = queue[head]
+            result[head] = node.value
+            head += 1
             
             if node.left:
-                queue.append(node.left)
+                queue[tail] = node.left
+                tail += 1
             if node.right:
-                queue.append(node.right)
+                queue[tail] = node.right
+                tail += 1
         
         return result
     
+    def inorder_iter(self) -> Iterator[int]:
+        """
+        Yield values in in-order (Left, Root, Right) without building a list.
+        The tree must not be modified while the iterator is in use.
+        
+        Yields:
+            Values in sorted order
+        """
+        stack = []
+        node = self.root
+        while stack or node:
+            # Descend to the leftmost unvisited node
+            while node:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+    
+    def preorder_iter(self) -> Iterator[int]:
+        """
+        Yield values in pre-order (Root, Left, Right) without building a list.
+        The tree must not be modified while the iterator is in use.
+        
+        Yields:
+            Values in pre-order sequence
+        """
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            yield node.value
+            if node.right:
+                stack.append(node.right)
+            if node.left:
+                stack.append(node.left)
+    
+    def postorder_iter(self) -> Iterator[int]:
+        """
+        Yield values in post-order (Left, Right, Root) without building a list.
+        The tree must not be modified while the iterator is in use.
+        
+        Yields:
+            Values in post-order sequence
+        """
+        stack = []
+        node = self.root
+        last = None
+        while stack or node:
+            if node:
+                stack.append(node)
+                node = node.left
+                continue
+            top = stack[-1]
+            # Visit the right subtree first unless we just came back from it
+            if top.right and top.right is not last:
+                node = top.right
+            else:
+                yield top.value
+                last = stack.pop()
+    
+    def levelorder_iter(self) -> Iterator[int]:
+        """
+        Yield values in level-order (BFS) without building a list.
+        The tree must not be modified while the iterator is in use.
+        
+        Yields:
+            Values level by level from top to bottom
+        """
+        if not self.root:
+            return
+        
+        # Same preallocated head/tail buffer as levelorder_traversal
+        queue = [None] * self._size
+        queue[0] = self.root
+        head, tail = 0, 1
+        while head < tail:
+            node = queue[head]
+            head += 1
+            yield node.value
+            if node.left:
+                queue[tail] = node.left
+                tail += 1
+            if node.right:
+                queue[tail] = node.right
+                tail += 1
+    
     def get_height(self) -> int:
         """
         Calculate the height of the tree.
@@ -282,22 +583,45 @@ class BinarySearchTree:
         Returns:
             Height of the tree (-1 for empty tree, 0 for single node)
         """
-        return self._calculate_height(self.root)
+        return self._height(self.root)
     
-    def _calculate_height(self, node: Optional[Node]) -> int:
+    def layout(self) -> bool:
         """
-        Recursively calculate the height of a subtree.
+        Assign visualization coordinates (node.x, node.y) to every node.
+        The root sits at (0, 0), each level is VERTICAL_GAP lower, and
+        children are offset horizontally by half of their parent's offset.
+        Coordinates depend only on the tree's shape, so they are computed
+        once per structural change and reused by every repaint after that.
         
-        Args:
-            node: Root of the subtree
-            
         Returns:
-            Height of the subtree
+            True if positions were recomputed, False if the cached ones are current
         """
-        if node is None:
-            return -1
-        return 1 + max(self._calculate_height(node.left), 
-                       self._calculate_height(node.right))
+        if self._layout_version == self._version:
+            return False
+        
+        if self.root:
+            # Horizontal child offset for each depth, halving per level
+            offsets = [0.0] * (self.root.height + 1)
+            offset = float(HORIZONTAL_GAP)
+            for depth in range(len(offsets)):
+                offsets[depth] = offset
+                offset /= 2
+            
+            stack = [(self.root, 0.0, 0.0, 0)]
+            while stack:
+                node, x, y, depth = stack.pop()
+                node.x, node.y = x, y
+                
+                offset = offsets[depth]
+                next_y = y + VERTICAL_GAP
+                depth += 1
+                if node.left:
+                    stack.append((node.left, x - offset, next_y, depth))
+                if node.right:
+                    stack.append((node.right, x + offset, next_y, depth))
+        
+        self._layout_version = self._version
+        return True
     
     def get_size(self) -> int:
         """
@@ -308,6 +632,7 @@ class BinarySearchTree:
         """
         return self._size
     
+    @cached_per_version
     def is_balanced(self) -> bool:
         """
         Check if the tree is balanced.
@@ -316,34 +641,77 @@ class BinarySearchTree:
         Returns:
             True if the tree is balanced, False otherwise
         """
-        def check_balance(node: Optional[Node]) -> tuple:
-            """
-            Check if subtree is balanced and return (is_balanced, height).
-            """
-            if node is None:
-                return True, -1
-            
-            left_balanced, left_height = check_balance(node.left)
-            if not left_balanced:
-                return False, 0
-            
-            right_balanced, right_height = check_balance(node.right)
-            if not right_balanced:
-                return False, 0
-            
-            is_current_balanced = abs(left_height - right_height) <= 1
-            height = 1 + max(left_height, right_height)
-            
-            return is_current_balanced, height
+        if self.self_balancing:
+            return True
         
-        balanced, _ = check_balance(self.root)
-        return balanced
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            if abs(self._height(node.left) - self._height(node.right)) > 1:
+                return False
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        
+        return True
+    
+    @cached_per_version
+    def minimum(self) -> Optional[int]:
+        """
+        Get the smallest value in the tree.
+        
+        Returns:
+            Minimum value, or None if the tree is empty
+        """
+        node = self.root
+        if node is None:
+            return None
+        while node.left is not None:
+            node = node.left
+        return node.value
+    
+    @cached_per_version
+    def maximum(self) -> Optional[int]:
+        """
+        Get the largest value in the tree.
+        
+        Returns:
+            Maximum value, or None if the tree is empty
+        """
+        node = self.root
+        if node is None:
+            return None
+        while node.right is not None:
+            node = node.right
+        return node.value
+    
+    @cached_per_version
+    def count_leaves(self) -> int:
+        """
+        Count the nodes that have no children.
+        
+        Returns:
+            Number of leaf nodes
+        """
+        count = 0
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            if node.left is None and node.right is None:
+                count += 1
+                continue
+            if node.left:
+                stack.append(node.left)
+            if node.right:
+                stack.append(node.right)
+        return count
     
     def clear(self):
         """Clear the entire tree."""
         self.root = None
         self._size = 0
-        self._height_cache = -1
+        self._mutated()
     
     def is_empty(self) -> bool:
         """Return True if the tree is empty."""
@@ -354,16 +722,96 @@ class BinarySearchTree:
         if not self.root:
             return []
         
-        nodes = []
-        queue = deque([self.root])
+        # The BFS buffer is itself the level-ordered node list
+        nodes = [None] * self._size
+        nodes[0] = self.root
+        head, tail = 0, 1
         
-        while queue:
-            node = queue.popleft()
-            nodes.append(node)
+        while head < tail:
+            node = nodes[head]
+            head += 1
             
             if node.left:
-                queue.append(node.left)
+                nodes[tail] = node.left
+                tail += 1
             if node.right:
-                queue.append(node.right)
+                nodes[tail] = node.right
+                tail += 1
         
         return nodes
+    
+    def __getstate__(self) -> dict:
+        """
+        Pickle the tree as flat pre-order data instead of a graph of nodes.
+        Each node contributes its value and one shape byte (bit 0: has a
+        left child, bit 1: has a right child), so pickling neither recurses
+        through the links nor stores cached results.
+        
+        Returns:
+            Picklable state dictionary
+        """
+        values = [0] * self._size
+        shape = bytearray(self._size)
+        index = 0
+        stack = [self.root] if self.root else []
+        while stack:
+            node = stack.pop()
+            values[index] = node.value
+            left = node.left
+            right = node.right
+            shape[index] = (left is not None) | ((right is not None) << 1)
+            index += 1
+            if right is not None:
+                stack.append(right)
+            if left is not None:
+                stack.append(left)
+        
+        return {
+            'self_balancing': self.self_balancing,
+            'values': values,
+            'shape': bytes(shape),
+        }
+    
+    def __setstate__(self, state: dict):
+        """
+        Rebuild a pickled tree by relinking its nodes in pre-order.
+        No value comparisons are needed, so this is much cheaper than
+        re-inserting the values.
+        
+        Args:
+            state: State dictionary produced by __getstate__
+        """
+        self.__init__(state['self_balancing'])
+        values = state['values']
+        if not values:
+            return
+        
+        nodes = [Node(value) for value in values]
+        shape = state['shape']
+        # In pre-order a node's left child comes right after it, and its
+        # right child right after its whole left subtree
+        awaiting_right = []
+        previous = None
+        previous_shape = 0
+        for node, node_shape in zip(nodes, shape):
+            if previous is not None:
+                if previous_shape & 1:
+                    parent = previous
+                    parent.left = node
+                else:
+                    parent = awaiting_right.pop()
+                    parent.right = node
+                node.parent = parent
+            if node_shape & 2:
+                awaiting_right.append(node)
+            previous = node
+            previous_shape = node_shape
+        
+        # Reversed pre-order visits every child before its parent
+        for node in reversed(nodes):
+            left_height = node.left.height if node.left else -1
+            right_height = node.right.height if node.right else -1
+            node.height = 1 + max(left_height, right_height)
+        
+        self.root = nodes[0]
+        self._size = len(nodes)
@@ -0,0 +1,31 @@
+"""Memoization helpers for tree queries."""
+from functools import wraps
+
+
+def cached_per_version(method):
+    """
+    Cache a no-argument tree query until the tree is next modified.
+
+    The decorated method's result is stored on the instance together with
+    the tree's _version counter, and is recomputed only once the counter
+    has moved on. Trees bump _version on every structural change, so any
+    derived query can be memoized by adding this decorator.
+
+    Args:
+        method: Method taking only self
+
+    Returns:
+        Wrapped method returning the cached result while it is current
+    """
+    attr = '_cached_' + method.__name__
+
+    @wraps(method)
+    def wrapper(self):
+        cached = self.__dict__.get(attr)
+        if cached is not None and cached[0] == self._version:
+            return cached[1]
+        result = method(self)
+        self.__dict__[attr] = (self._version, result)
+        return result
+
+    return wrapper
@@ -10,9 +10,18 @@ class Node:
         left: Reference to the left child node
         right: Reference to the right child node
         parent: Reference to the parent node (useful for visualization)
+        height: Height of the subtree rooted at this node (0 for a leaf)
         x, y: Visual coordinates for rendering (set by visualization engine)
     """
     
+    # Fixed attribute layout: no per-instance __dict__, smaller nodes and
+    # faster attribute access
+    __slots__ = (
+        'value', 'left', 'right', 'parent', 'height',
+        'x', 'y', 'radius',
+        'is_highlighted', 'is_searching', 'animation_progress',
+    )
+    
     def __init__(self, value: int, parent=None):
         """
         Initialize a node with the given value.
@@ -25,6 +34,7 @@ class Node:
         self.left = None
         self.right = None
         self.parent = parent
+        self.height = 0
         
         # Visual properties for rendering
         self.x = 0
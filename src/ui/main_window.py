@@ -1,17 +1,18 @@
 """Main application window."""
-from PyQt5.QtWidgets import QMainWindow, QHBoxLayout, QVBoxLayout, QWidget, QMessageBox, QFileDialog
-from PyQt5.QtCore import Qt, pyqtSlot
-from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import QMainWindow, QHBoxLayout, QVBoxLayout, QWidget, QMessageBox
+from PyQt5.QtCore import QTimer, pyqtSlot
+import pickle
 import random
-from typing import List, Optional
+from typing import Optional
 
 from src.models import BinarySearchTree
 from src.ui.widgets import TreeCanvas, ControlPanel, InfoPanel
 from src.ui.styles import ThemeManager
-from src.utils import OperationHistory, Operation, TreeExporter
+from src.utils import OperationHistory, TreeOp, TreeExporter
 from src.config import (
     WINDOW_WIDTH, WINDOW_HEIGHT, WINDOW_TITLE, MAX_TREE_SIZE,
-    MAX_NODE_VALUE, MIN_NODE_VALUE
+    MAX_NODE_VALUE, MIN_NODE_VALUE, RESIZE_REDRAW_DELAY, TRAVERSAL_INORDER,
+    TRAVERSAL_PREORDER, TRAVERSAL_POSTORDER, TRAVERSAL_LEVELORDER
 )
 
 
@@ -27,13 +28,23 @@ class MainWindow(QMainWindow):
         
         # Initialize components
         self.tree = BinarySearchTree()
-        self.history = OperationHistory()
+        self.history = OperationHistory(target=self)
         self.theme_manager = ThemeManager()
-        self.exporter = TreeExporter()
+        # Built on first use, see the exporter property
+        self._exporter: Optional[TreeExporter] = None
         
         # Track original tree state for undo/redo
         self.operation_in_progress = False
         
+        # Theme currently applied to the widgets (None until the first apply)
+        self._applied_theme = None
+        
+        # (tree, version) the info panel statistics were last computed for
+        self._display_key = None
+        
+        # (tree, version, snapshot) of the last snapshot taken or restored
+        self._tree_state = None
+        
         # Setup UI
         self.init_ui()
         
@@ -43,6 +54,13 @@ class MainWindow(QMainWindow):
         # Show welcome message
         self.info_panel.set_message("Welcome to BST Visualizer! Insert nodes to get started.")
     
+    @property
+    def exporter(self) -> TreeExporter:
+        """Image exporter, created the first time an export needs it."""
+        if self._exporter is None:
+            self._exporter = TreeExporter()
+        return self._exporter
+    
     def init_ui(self):
         """Initialize the user interface."""
         # Set window properties
@@ -62,6 +80,12 @@ class MainWindow(QMainWindow):
         self.canvas.setStyleSheet("border: 3px solid #3498db; border-radius: 8px;")
         main_layout.addWidget(self.canvas, 2)  # Takes 2/3 of space
         
+        # Single-shot timer that coalesces a burst of resize events into one redraw
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(RESIZE_REDRAW_DELAY)
+        self._resize_timer.timeout.connect(self.canvas.redraw)
+        
         # Create side panel with two columns in vertical stack
         side_layout = QVBoxLayout()
         side_layout.setContentsMargins(0, 0, 0, 0)
@@ -83,15 +107,32 @@ class MainWindow(QMainWindow):
         central_widget.setLayout(main_layout)
         self.setCentralWidget(central_widget)
         
+        # Confirmation dialogs are built once and reused on every prompt
+        self._confirm_reset = QMessageBox(
+            QMessageBox.Question,
+            "Clear Tree",
+            "Are you sure you want to clear the entire tree?",
+            QMessageBox.Yes | QMessageBox.No,
+            self
+        )
+        self._confirm_exit = QMessageBox(
+            QMessageBox.Question,
+            "Confirm Exit",
+            "Are you sure you want to exit? Unsaved changes will be lost.",
+            QMessageBox.Yes | QMessageBox.No,
+            self
+        )
+        
         # Apply theme
         self.apply_theme()
     
     def resizeEvent(self, event):
         """Handle window resize events for responsive layout."""
         super().resizeEvent(event)
-        # Redraw the tree to fit the new window size
+        # Redraw the tree to fit the new window size once resizing pauses;
+        # restarting the timer pushes the redraw back on every event
         if self.tree and not self.tree.is_empty():
-            self.canvas.redraw()
+            self._resize_timer.start()
     
     def connect_signals(self):
         """Connect signals from widgets to slots."""
@@ -121,27 +162,9 @@ class MainWindow(QMainWindow):
             self.info_panel.set_message(f"Error: Maximum tree size ({MAX_TREE_SIZE}) reached!")
             return
         
-        # Create operation for undo/redo
-        original_tree_state = self._get_tree_state()
-        
-        def undo_action():
-            self._restore_tree_state(original_tree_state)
-            self.update_display()
-        
         if self.tree.insert(value):
-            new_tree_state = self._get_tree_state()
-            
-            def redo_action():
-                self._restore_tree_state(new_tree_state)
-                self.update_display()
-            
             # Record operation
-            operation = Operation(
-                name=f"Insert {value}",
-                undo_action=undo_action,
-                redo_action=redo_action
-            )
-            self.history.record_operation(operation)
+            self.history.record_operation(TreeOp(TreeOp.INSERT, value))
             
             # Highlight the inserted node
             self.canvas.highlight_node(value, 600)
@@ -151,7 +174,8 @@ class MainWindow(QMainWindow):
             self.info_panel.set_message(f"Error: {value} already exists in the tree!")
             return
         
-        self.update_display()
+        # The canvas refresh queued by highlight_node() also picks up the new node
+        self.update_display(redraw_canvas=False)
     
     @pyqtSlot(int)
     def on_delete(self, value: int):
@@ -161,25 +185,11 @@ class MainWindow(QMainWindow):
         Args:
             value: Node value to delete
         """
-        original_tree_state = self._get_tree_state()
-        
-        def undo_action():
-            self._restore_tree_state(original_tree_state)
-            self.update_display()
+        # Only the subtree under the deleted node changes shape
+        subtree = self.tree.get_subtree_preorder(value)
         
         if self.tree.delete(value):
-            new_tree_state = self._get_tree_state()
-            
-            def redo_action():
-                self._restore_tree_state(new_tree_state)
-                self.update_display()
-            
-            operation = Operation(
-                name=f"Delete {value}",
-                undo_action=undo_action,
-                redo_action=redo_action
-            )
-            self.history.record_operation(operation)
+            self.history.record_operation(TreeOp(TreeOp.DELETE, value, subtree=subtree))
             
             self.info_panel.set_last_operation(f"Deleted node: {value}")
             self.info_panel.set_message(f"Successfully deleted {value}")
@@ -206,8 +216,6 @@ class MainWindow(QMainWindow):
         else:
             self.info_panel.set_message(f"Not found: {value} is not in the tree!")
             self.info_panel.set_last_operation(f"Search failed: {value}")
-        
-        self.canvas.redraw()
     
     @pyqtSlot()
     def on_reset(self):
@@ -217,35 +225,18 @@ class MainWindow(QMainWindow):
             return
         
         # Confirmation dialog
-        reply = QMessageBox.question(
-            self,
-            "Clear Tree",
-            "Are you sure you want to clear the entire tree?",
-            QMessageBox.Yes | QMessageBox.No
-        )
+        reply = self._confirm_reset.exec_()
         
         if reply == QMessageBox.Yes:
-            original_tree_state = self._get_tree_state()
-            
-            def undo_action():
-                self._restore_tree_state(original_tree_state)
-                self.update_display()
-            
+            original_tree_state = self.get_tree_state()
             self.tree.clear()
             self.history.clear()
             
-            new_tree_state = self._get_tree_state()
-            
-            def redo_action():
-                self._restore_tree_state(new_tree_state)
-                self.update_display()
-            
-            operation = Operation(
-                name="Clear tree",
-                undo_action=undo_action,
-                redo_action=redo_action
-            )
-            self.history.record_operation(operation)
+            self.history.record_operation(TreeOp(
+                TreeOp.CLEAR,
+                before=original_tree_state,
+                after=self.get_tree_state()
+            ))
             
             self.info_panel.clear()
             self.info_panel.set_message("Tree cleared!")
@@ -259,42 +250,35 @@ class MainWindow(QMainWindow):
         Args:
             count: Number of nodes to generate
         """
-        original_tree_state = self._get_tree_state()
-        
-        def undo_action():
-            self._restore_tree_state(original_tree_state)
-            self.update_display()
-        
+        # Checkpoint the old tree so undo is one restore, not N deletes
+        original_tree_state = self.get_tree_state()
         self.tree.clear()
         
-        # Generate random values
-        values = []
-        while len(values) < count:
-            val = random.randint(MIN_NODE_VALUE, MAX_NODE_VALUE)
-            if val not in values:
-                values.append(val)
-        
-        # Insert values
-        for val in values:
-            self.tree.insert(val)
-        
-        new_tree_state = self._get_tree_state()
-        
-        def redo_action():
-            self._restore_tree_state(new_tree_state)
-            self.update_display()
-        
-        operation = Operation(
-            name=f"Generate random tree ({count} nodes)",
-            undo_action=undo_action,
-            redo_action=redo_action
-        )
-        self.history.record_operation(operation)
+        # Generate distinct random values (sample cannot draw more than the range holds)
+        value_range = range(MIN_NODE_VALUE, MAX_NODE_VALUE + 1)
+        values = random.sample(value_range, min(count, len(value_range)))
+        
+        # Insert all values in one call with the canvas frozen, so the
+        # tree is painted once by update_display() below
+        self.canvas.setUpdatesEnabled(False)
+        self.canvas.blockSignals(True)
+        try:
+            self.tree.extend(values)
+        finally:
+            self.canvas.blockSignals(False)
+            self.canvas.setUpdatesEnabled(True)
+        
+        self.history.record_operation(TreeOp(
+            TreeOp.BULK,
+            len(values),
+            before=original_tree_state,
+            after=self.get_tree_state()
+        ))
         
         self.info_panel.set_message(f"Generated random tree with {count} nodes!")
         self.update_display()
     
-    @pyqtSlot(str)
+    @pyqtSlot(object)
     def on_traversal(self, traversal_type: str):
         """
         Perform tree traversal.
@@ -307,13 +291,13 @@ class MainWindow(QMainWindow):
             return
         
         # Get traversal result
-        if traversal_type == "inorder":
+        if traversal_type == TRAVERSAL_INORDER:
             result = self.tree.inorder_traversal()
-        elif traversal_type == "preorder":
+        elif traversal_type == TRAVERSAL_PREORDER:
             result = self.tree.preorder_traversal()
-        elif traversal_type == "postorder":
+        elif traversal_type == TRAVERSAL_POSTORDER:
             result = self.tree.postorder_traversal()
-        elif traversal_type == "level-order":
+        elif traversal_type == TRAVERSAL_LEVELORDER:
             result = self.tree.levelorder_traversal()
         else:
             return
@@ -324,7 +308,7 @@ class MainWindow(QMainWindow):
         self.info_panel.set_last_operation(f"{traversal_type.title()} traversal")
         
         # Animate if checkbox is checked
-        if self.control_panel.animate_traversal_check.isChecked():
+        if self.control_panel.is_traversal_animated():
             self.canvas.animate_traversal(result)
         else:
             self.canvas.clear_search_path()
@@ -370,55 +354,98 @@ class MainWindow(QMainWindow):
     
     def apply_theme(self):
         """Apply current theme to the application."""
-        stylesheet = self.theme_manager.get_stylesheet()
-        self.setStyleSheet(stylesheet)
-        self.canvas.set_dark_mode(self.theme_manager.is_dark_theme())
+        # Re-setting a stylesheet re-polishes every widget, so skip no-ops
+        theme = self.theme_manager.current_theme
+        if theme == self._applied_theme:
+            return
+        self._applied_theme = theme
+        
+        self.setStyleSheet(self.theme_manager.get_stylesheet())
+        dark = self.theme_manager.is_dark_theme()
+        self.canvas.set_dark_mode(dark)
+        # Keeps the checkbox right when the theme is not set by clicking it
+        self.control_panel.set_dark_mode(dark)
     
-    def update_display(self):
-        """Update all display elements."""
-        # Redraw canvas
-        self.canvas.redraw()
+    def update_display(self, redraw_canvas: bool = True):
+        """
+        Update all display elements.
         
-        # Update tree info
-        size = self.tree.get_size()
-        height = self.tree.get_height()
-        is_balanced = self.tree.is_balanced()
+        Args:
+            redraw_canvas: False if the caller has already updated the canvas
+        """
+        # Redraw canvas
+        if redraw_canvas:
+            self.canvas.redraw()
         
-        self.info_panel.update_tree_info(size, height, is_balanced)
+        # Update tree info, only if the tree changed since the last update
+        tree = self.tree
+        display_key = self._display_key
+        if display_key is None or display_key[0] is not tree or display_key[1] != tree.version:
+            self._display_key = (tree, tree.version)
+            
+            size = tree.get_size()
+            height = tree.get_height()
+            is_balanced = tree.is_balanced()
+            
+            self.info_panel.update_tree_info(size, height, is_balanced)
         
         # Update undo/redo button states
         self.control_panel.enable_undo(self.history.can_undo())
         self.control_panel.enable_redo(self.history.can_redo())
     
-    def _get_tree_state(self) -> List[int]:
+    def get_tree_state(self) -> bytes:
         """
-        Get the current state of the tree as a serializable list.
+        Get the current state of the tree as a serializable snapshot.
         
         Returns:
-            List of node values in pre-order traversal
+            Pickled tree, or b'' for an empty tree
         """
-        return self.tree.preorder_traversal()
+        tree = self.tree
+        if tree.is_empty():
+            return b''
+        cached = self._tree_state
+        if cached is not None and cached[0] is tree and cached[1] == tree.version:
+            return cached[2]
+        
+        state = pickle.dumps(tree, protocol=pickle.HIGHEST_PROTOCOL)
+        self._tree_state = (tree, tree.version, state)
+        return state
     
-    def _restore_tree_state(self, state: List[int]):
+    def _is_tree_state(self, state: bytes) -> bool:
+        """Return True if the tree is known to match a snapshot, without pickling it."""
+        cached = self._tree_state
+        tree = self.tree
+        return (
+            cached is not None and cached[0] is tree
+            and cached[1] == tree.version and cached[2] == state
+        )
+    
+    def restore_tree_state(self, state: bytes):
         """
         Restore the tree to a previous state.
         
         Args:
-            state: List of node values to restore
+            state: Snapshot from get_tree_state()
         """
-        self.tree.clear()
-        for value in state:
-            self.tree.insert(value)
+        # Empty snapshot: clearing in place is enough
+        if not state:
+            if not self.tree.is_empty():
+                self.tree.clear()
+            return
+        
+        # Already in that state: the snapshot was taken from this tree version
+        if self._is_tree_state(state):
+            return
+        
+        self.tree = pickle.loads(state)
+        self._tree_state = (self.tree, self.tree.version, state)
+        # Undo/redo call update_display() next, which redraws the canvas
+        self.canvas.set_tree(self.tree, redraw=False)
     
     def closeEvent(self, event):
         """Handle application close event."""
         if not self.tree.is_empty():
-            reply = QMessageBox.question(
-                self,
-                "Confirm Exit",
-                "Are you sure you want to exit? Unsaved changes will be lost.",
-                QMessageBox.Yes | QMessageBox.No
-            )
+            reply = self._confirm_exit.exec_()
             
             if reply == QMessageBox.No:
                 event.ignore()
@@ -2,26 +2,26 @@
 from src.config import COLORS_LIGHT, COLORS_DARK
 
 
-def get_light_theme_stylesheet() -> str:
-    """Get the light theme stylesheet."""
-    return f"""
+# Shared stylesheet for both themes; every {name} field is a key of the
+# theme's color table in config
+_QSS_TEMPLATE = """
     QMainWindow {{
-        background-color: {COLORS_LIGHT['background']};
+        background-color: {background};
     }}
     
     QWidget {{
-        background-color: {COLORS_LIGHT['background']};
-        color: {COLORS_LIGHT['text']};
+        background-color: {background};
+        color: {text};
     }}
     
     QGroupBox {{
-        border: 2px solid {COLORS_LIGHT['primary']};
+        border: 2px solid {primary};
         border-radius: 8px;
         margin-top: 12px;
         padding-top: 12px;
         font-weight: bold;
         font-size: 12px;
-        color: {COLORS_LIGHT['text']};
+        color: {text};
     }}
     
     QGroupBox::title {{
@@ -31,7 +31,7 @@ def get_light_theme_stylesheet() -> str:
     }}
     
     QPushButton {{
-        background-color: {COLORS_LIGHT['primary']};
+        background-color: {primary};
         color: white;
         border: none;
         border-radius: 6px;
@@ -43,93 +43,96 @@ def get_light_theme_stylesheet() -> str:
     
     QPushButton:hover {{
         background-color: #2980b9;
-        transform: scale(1.02);
     }}
     
     QPushButton:pressed {{
-        background-color: #2471a3;
+        background-color: {primary_pressed};
     }}
     
     QPushButton:disabled {{
-        background-color: #bdc3c7;
-        color: #95a5a6;
+        background-color: {disabled};
+        color: {disabled_text};
     }}
     
     QPushButton#dangerButton {{
-        background-color: {COLORS_LIGHT['danger']};
+        background-color: {danger};
     }}
     
     QPushButton#dangerButton:hover {{
-        background-color: #c0392b;
+        background-color: {danger_hover};
     }}
     
     QPushButton#successButton {{
-        background-color: {COLORS_LIGHT['success']};
+        background-color: {success};
     }}
     
     QPushButton#successButton:hover {{
-        background-color: #27ae60;
+        background-color: {success_hover};
     }}
     
     QLineEdit {{
-        border: 2px solid {COLORS_LIGHT['border']};
+        border: 2px solid {border};
         border-radius: 6px;
         padding: 10px;
-        background-color: {COLORS_LIGHT['background']};
-        color: {COLORS_LIGHT['text']};
+        background-color: {input_background};
+        color: {text};
         font-size: 12px;
         min-height: 38px;
     }}
     
     QLineEdit:focus {{
-        border: 2px solid {COLORS_LIGHT['primary']};
+        border: 2px solid {primary};
+    }}
+    
+    QLineEdit[invalid="true"] {{
+        border: 2px solid red;
     }}
     
     QLabel {{
-        color: {COLORS_LIGHT['text']};
+        color: {text};
         font-size: 12px;
     }}
     
     QComboBox {{
-        border: 2px solid {COLORS_LIGHT['border']};
+        border: 2px solid {border};
         border-radius: 5px;
         padding: 6px;
-        background-color: {COLORS_LIGHT['background']};
-        color: {COLORS_LIGHT['text']};
+        background-color: {input_background};
+        color: {text};
     }}
     
     QComboBox:focus {{
-        border: 2px solid {COLORS_LIGHT['primary']};
+        border: 2px solid {primary};
     }}
     
     QSpinBox {{
-        border: 2px solid {COLORS_LIGHT['border']};
+        border: 2px solid {border};
         border-radius: 5px;
         padding: 6px;
-        background-color: {COLORS_LIGHT['background']};
-        color: {COLORS_LIGHT['text']};
+        background-color: {input_background};
+        color: {text};
     }}
     
-    QTextEdit {{
-        border: 2px solid {COLORS_LIGHT['border']};
+    QTextEdit, QPlainTextEdit {{
+        border: 2px solid {border};
         border-radius: 5px;
         padding: 8px;
-        background-color: {COLORS_LIGHT['background']};
-        color: {COLORS_LIGHT['text']};
+        background-color: {input_background};
+        color: {text};
         font-family: Courier New;
         font-size: 10px;
     }}
     
     QSlider::groove:horizontal {{
-        border: 1px solid {COLORS_LIGHT['border']};
+        border: 1px solid {border};
         height: 8px;
-        background: {COLORS_LIGHT['light']};
+        background: {slider_groove};
         border-radius: 4px;
     }}
     
     QSlider::handle:horizontal {{
-        background: {COLORS_LIGHT['primary']};
-        border: 1px solid {COLORS_LIGHT['primary']};
+        background: {primary};
+        border: 1px solid {primary};
         width: 18px;
         margin: -5px 0;
         border-radius: 9px;
@@ -140,7 +143,7 @@ def get_light_theme_stylesheet() -> str:
     }}
     
     QCheckBox {{
-        color: {COLORS_LIGHT['text']};
+        color: {text};
         font-size: 11px;
     }}
     
@@ -150,223 +153,55 @@ def get_light_theme_stylesheet() -> str:
     }}
     
     QCheckBox::indicator:unchecked {{
-        background-color: {COLORS_LIGHT['background']};
-        border: 2px solid {COLORS_LIGHT['border']};
+        background-color: {input_background};
+        border: 2px solid {border};
         border-radius: 3px;
     }}
     
     QCheckBox::indicator:checked {{
-        background-color: {COLORS_LIGHT['primary']};
-        border: 2px solid {COLORS_LIGHT['primary']};
+        background-color: {primary};
+        border: 2px solid {primary};
         border-radius: 3px;
     }}
     
     QStatusBar {{
-        background-color: {COLORS_LIGHT['background']};
-        color: {COLORS_LIGHT['text']};
-        border-top: 1px solid {COLORS_LIGHT['border']};
+        background-color: {background};
+        color: {text};
+        border-top: 1px solid {border};
     }}
     
     QMenuBar {{
-        background-color: {COLORS_LIGHT['background']};
-        color: {COLORS_LIGHT['text']};
-        border-bottom: 1px solid {COLORS_LIGHT['border']};
+        background-color: {background};
+        color: {text};
+        border-bottom: 1px solid {border};
     }}
     
     QMenu {{
-        background-color: {COLORS_LIGHT['background']};
-        color: {COLORS_LIGHT['text']};
-        border: 1px solid {COLORS_LIGHT['border']};
+        background-color: {background};
+        color: {text};
+        border: 1px solid {border};
     }}
     
     QMenu::item:selected {{
-        background-color: {COLORS_LIGHT['primary']};
+        background-color: {primary};
         color: white;
     }}
     """
 
 
+def get_light_theme_stylesheet() -> str:
+    """Get the light theme stylesheet."""
+    return _QSS_TEMPLATE.format_map(COLORS_LIGHT)
+
+
 def get_dark_theme_stylesheet() -> str:
     """Get the dark theme stylesheet."""
-    return f"""
-    QMainWindow {{
-        background-color: {COLORS_DARK['background']};
-    }}
-    
-    QWidget {{
-        background-color: {COLORS_DARK['background']};
-        color: {COLORS_DARK['text']};
-    }}
-    
-    QGroupBox {{
-        border: 2px solid {COLORS_DARK['primary']};
-        border-radius: 8px;
-        margin-top: 12px;
-        padding-top: 12px;
-        font-weight: bold;
-        font-size: 12px;
-        color: {COLORS_DARK['text']};
-    }}
-    
-    QGroupBox::title {{
-        subcontrol-origin: margin;
-        left: 15px;
-        padding: 0 5px 0 5px;
-    }}
-    
-    QPushButton {{
-        background-color: {COLORS_DARK['primary']};
-        color: white;
-        border: none;
-        border-radius: 6px;
-        padding: 10px 20px;
-        font-weight: bold;
-        font-size: 12px;
-        min-height: 40px;
-    }}
-    
-    QPushButton:hover {{
-        background-color: #2980b9;
-    }}
-    
-    QPushButton:pressed {{
-        background-color: #1f618d;
-    }}
-    
-    QPushButton:disabled {{
-        background-color: #555555;
-        color: #888888;
-    }}
-    
-    QPushButton#dangerButton {{
-        background-color: {COLORS_DARK['danger']};
-    }}
-    
-    QPushButton#dangerButton:hover {{
-        background-color: #a93226;
-    }}
-    
-    QPushButton#successButton {{
-        background-color: {COLORS_DARK['success']};
-    }}
-    
-    QPushButton#successButton:hover {{
-        background-color: #28a745;
-    }}
-    
-    QLineEdit {{
-        border: 2px solid {COLORS_DARK['border']};
-        border-radius: 6px;
-        padding: 10px;
-        background-color: #1a1a1a;
-        color: {COLORS_DARK['text']};
-        font-size: 12px;
-        min-height: 38px;
-    }}
-    
-    QLineEdit:focus {{
-        border: 2px solid {COLORS_DARK['primary']};
-    }}
-    
-    QLabel {{
-        color: {COLORS_DARK['text']};
-        font-size: 12px;
-    }}
-    
-    QComboBox {{
-        border: 2px solid {COLORS_DARK['border']};
-        border-radius: 5px;
-        padding: 6px;
-        background-color: #1a1a1a;
-        color: {COLORS_DARK['text']};
-    }}
-    
-    QComboBox:focus {{
-        border: 2px solid {COLORS_DARK['primary']};
-    }}
-    
-    QSpinBox {{
-        border: 2px solid {COLORS_DARK['border']};
-        border-radius: 5px;
-        padding: 6px;
-        background-color: #1a1a1a;
-        color: {COLORS_DARK['text']};
-    }}
-    
-    QTextEdit {{
-        border: 2px solid {COLORS_DARK['border']};
-        border-radius: 5px;
-        padding: 8px;
-        background-color: #1a1a1a;
-        color: {COLORS_DARK['text']};
-        font-family: Courier New;
-        font-size: 10px;
-    }}
-    
-    QSlider::groove:horizontal {{
-        border: 1px solid {COLORS_DARK['border']};
-        height: 8px;
-        background: #444444;
-        border-radius: 4px;
-    }}
-    
-    QSlider::handle:horizontal {{
-        background: {COLORS_DARK['primary']};
-        border: 1px solid {COLORS_DARK['primary']};
-        width: 18px;
-        margin: -5px 0;
-        border-radius: 9px;
-    }}
-    
-    QSlider::handle:horizontal:hover {{
-        background: #2980b9;
-    }}
-    
-    QCheckBox {{
-        color: {COLORS_DARK['text']};
-        font-size: 11px;
-    }}
-    
-    QCheckBox::indicator {{
-        width: 18px;
-        height: 18px;
-    }}
-    
-    QCheckBox::indicator:unchecked {{
-        background-color: #1a1a1a;
-        border: 2px solid {COLORS_DARK['border']};
-        border-radius: 3px;
-    }}
-    
-    QCheckBox::indicator:checked {{
-        background-color: {COLORS_DARK['primary']};
-        border: 2px solid {COLORS_DARK['primary']};
-        border-radius: 3px;
-    }}
-    
-    QStatusBar {{
-        background-color: {COLORS_DARK['background']};
-        color: {COLORS_DARK['text']};
-        border-top: 1px solid {COLORS_DARK['border']};
-    }}
-    
-    QMenuBar {{
-        background-color: {COLORS_DARK['background']};
-        color: {COLORS_DARK['text']};
-        border-bottom: 1px solid {COLORS_DARK['border']};
-    }}
-    
-    QMenu {{
-        background-color: {COLORS_DARK['background']};
-        color: {COLORS_DARK['text']};
-        border: 1px solid {COLORS_DARK['border']};
-    }}
-    
-    QMenu::item:selected {{
-        background-color: {COLORS_DARK['primary']};
-        color: white;
-    }}
-    """
+    return _QSS_TEMPLATE.format_map(COLORS_DARK)
+
+
+# Stylesheets only depend on the color tables, so build each one once
+_LIGHT_QSS = get_light_theme_stylesheet()
+_DARK_QSS = get_dark_theme_stylesheet()
 
 
 class ThemeManager:
@@ -381,9 +216,7 @@ class ThemeManager:
     
     def get_stylesheet(self) -> str:
         """Get the current theme stylesheet."""
-        if self.current_theme == self.DARK:
-            return get_dark_theme_stylesheet()
-        return get_light_theme_stylesheet()
+        return _DARK_QSS if self.current_theme == self.DARK else _LIGHT_QSS
     
     def toggle_theme(self):
         """Toggle between light and dark themes."""
@@ -1,14 +1,42 @@
 """Control panel widget for user interactions."""
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QGroupBox, QPushButton,
-    QLineEdit, QLabel, QComboBox, QSpinBox, QCheckBox, QTextEdit, QScrollArea
+    QLineEdit, QLabel, QComboBox, QSpinBox, QCheckBox, QPlainTextEdit
 )
-from PyQt5.QtCore import pyqtSignal, Qt
+from PyQt5.QtCore import pyqtSignal, Qt, QSignalBlocker
 from PyQt5.QtGui import QIntValidator, QFont
-from src.config import MIN_NODE_VALUE, MAX_NODE_VALUE
+import sys
+from typing import Optional
 
+from src.config import (
+    MIN_NODE_VALUE, MAX_NODE_VALUE, TRAVERSAL_INORDER, TRAVERSAL_PREORDER,
+    TRAVERSAL_POSTORDER, TRAVERSAL_LEVELORDER
+)
+from .side_panel import SidePanel
+
+
+# Value input sections, built by ControlPanel._create_value_section:
+# (name, title, placeholder, input tooltip, button text, button object name,
+# button tooltip). Each creates <name>_input and <name>_btn, wired to
+# _on_<name>_clicked.
+_VALUE_SECTIONS = [
+    ("insert", "📥 Insert Node", "Enter value (e.g., 50)",
+     "Enter an integer value and press Enter or click Insert",
+     "✓ Insert Node", "successButton", "Click to insert the node into the BST"),
+    ("delete", "🗑️ Delete Node", "Enter value to delete",
+     "Enter the value of node to delete",
+     "✕ Delete Node", "dangerButton", "Click to delete the node from the BST"),
+    ("search", "🔍 Search Node", "Enter value to search",
+     "Enter the value to search for in the tree",
+     "🔎 Search", None, "Click to search for the value in the tree"),
+]
 
-class ControlPanel(QWidget):
+
+# Styling comes from the theme stylesheet, which MainWindow installs once
+# after the whole widget tree is built, so widgets are only resolved against
+# it in their final state. Buttons get their object name (the stylesheet
+# selector) right after construction, before any other setup.
+class ControlPanel(SidePanel):
     """
     Control panel for user interactions with the BST.
     Provides buttons and input fields for all operations.
@@ -20,24 +48,56 @@ class ControlPanel(QWidget):
     search_requested = pyqtSignal(int)
     reset_requested = pyqtSignal()
     random_tree_requested = pyqtSignal(int)  # Emits number of nodes
-    traversal_requested = pyqtSignal(str)  # Emits traversal type
+    traversal_requested = pyqtSignal(object)  # Emits a TRAVERSAL_* constant (passed through as is)
     undo_requested = pyqtSignal()
     redo_requested = pyqtSignal()
     theme_toggled = pyqtSignal(bool)  # Emits True for dark
     
+    # Fonts and the value validator are shared by every widget that uses
+    # them (QFont is implicitly shared, so one instance per style is
+    # enough). Created by the first __init__, once a QApplication exists.
+    _title_font: Optional[QFont] = None
+    _bold_11: Optional[QFont] = None
+    _reg_11: Optional[QFont] = None
+    _reg_10: Optional[QFont] = None
+    _mono_10: Optional[QFont] = None
+    _int_validator: Optional[QIntValidator] = None
+    
     def __init__(self, parent=None):
         """Initialize the control panel."""
         super().__init__(parent)
+        self._init_shared_resources()
         # Don't set fixed width - let parent handle sizing
+        
+        # These sections are filled in on the first show (or first use),
+        # not while the window is being constructed
+        self._section_builders = {
+            "traversal": self._build_traversal_section,
+            "generation": self._build_tree_generation_section,
+            "output": self._build_output_section,
+        }
+        self._section_groups = {}
+        self._built_sections = set()
+        
+        # Text currently in the traversal output
+        self._last_output = ""
+        
         self.init_ui()
     
+    @classmethod
+    def _init_shared_resources(cls):
+        """Create the shared fonts and validator, unless already done."""
+        if cls._int_validator is not None:
+            return
+        cls._title_font = QFont("Segoe UI", 14, QFont.Bold)
+        cls._bold_11 = QFont("Segoe UI", 11, QFont.Bold)
+        cls._reg_11 = QFont("Segoe UI", 11)
+        cls._reg_10 = QFont("Segoe UI", 10)
+        cls._mono_10 = QFont("Courier New", 10)
+        cls._int_validator = QIntValidator(MIN_NODE_VALUE, MAX_NODE_VALUE)
+    
     def init_ui(self):
         """Initialize the user interface."""
-        # Use scroll area for responsive, fullscreen-friendly design
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
-        
         scroll_content = QWidget()
         layout = QVBoxLayout()
         layout.setSpacing(10)
@@ -45,28 +105,19 @@ class ControlPanel(QWidget):
         
         # Title
         title = QLabel("🌳 BST Controls")
-        title_font = QFont("Segoe UI", 14, QFont.Bold)
-        title.setFont(title_font)
+        title.setFont(self._title_font)
         layout.addWidget(title)
         
-        # ===== Insert Section =====
-        insert_group = self._create_insert_section()
-        layout.addWidget(insert_group)
-        
-        # ===== Delete Section =====
-        delete_group = self._create_delete_section()
-        layout.addWidget(delete_group)
-        
-        # ===== Search Section =====
-        search_group = self._create_search_section()
-        layout.addWidget(search_group)
+        # ===== Insert / Delete / Search Sections =====
+        for section in _VALUE_SECTIONS:
+            layout.addWidget(self._create_value_section(*section))
         
         # ===== Traversal Section =====
-        traversal_group = self._create_traversal_section()
+        traversal_group = self._create_lazy_section("traversal", "🔄 Tree Traversal")
         layout.addWidget(traversal_group)
         
         # ===== Tree Generation =====
-        generation_group = self._create_tree_generation_section()
+        generation_group = self._create_lazy_section("generation", "🎲 Generate Random Tree")
         layout.addWidget(generation_group)
         
         # ===== Tree Operations =====
@@ -78,166 +129,198 @@ class ControlPanel(QWidget):
         layout.addWidget(settings_group)
         
         # ===== Output Display =====
-        output_group = self._create_output_section()
+        output_group = self._create_lazy_section("output", "📊 Traversal Output")
         layout.addWidget(output_group)
         
         # Add stretch to push everything to the top
         layout.addStretch()
         
         scroll_content.setLayout(layout)
-        scroll.setWidget(scroll_content)
         
-        # Main layout with scroll area
-        main_layout = QVBoxLayout()
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.addWidget(scroll)
-        self.setLayout(main_layout)
-    
-    def _create_insert_section(self) -> QGroupBox:
-        """Create the insert node section."""
-        group = QGroupBox("📥 Insert Node")
-        layout = QVBoxLayout()
-        layout.setSpacing(10)
-        
-        # Input field
-        input_label = QLabel("Node Value:")
-        input_label.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        self.insert_input = QLineEdit()
-        self.insert_input.setPlaceholderText("Enter value (e.g., 50)")
-        self.insert_input.setValidator(
-            QIntValidator(MIN_NODE_VALUE, MAX_NODE_VALUE)
+        # Scrolls only once the panel is too short for its contents
+        self.set_body(
+            scroll_content,
+            "QScrollArea { border: none; background: transparent; }"
         )
-        self.insert_input.setMinimumHeight(40)
-        self.insert_input.setFont(QFont("Segoe UI", 11))
-        self.insert_input.returnPressed.connect(self._on_insert_clicked)
-        self.insert_input.setToolTip("Enter an integer value and press Enter or click Insert")
-        
-        layout.addWidget(input_label)
-        layout.addWidget(self.insert_input)
-        
-        # Insert button
-        self.insert_btn = QPushButton("✓ Insert Node")
-        self.insert_btn.setObjectName("successButton")
-        self.insert_btn.setMinimumHeight(45)
-        self.insert_btn.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        self.insert_btn.clicked.connect(self._on_insert_clicked)
-        self.insert_btn.setToolTip("Click to insert the node into the BST")
-        layout.addWidget(self.insert_btn)
+    
+    def _create_lazy_section(self, key: str, title: str) -> QGroupBox:
+        """
+        Create a section whose contents are built later by _build_section().
         
-        group.setLayout(layout)
+        Args:
+            key: Key of the section's builder in _section_builders
+            title: Group box title
+            
+        Returns:
+            Group box with an empty layout
+        """
+        group = QGroupBox(title)
+        group.setLayout(QVBoxLayout())
+        self._section_groups[key] = group
         return group
     
-    def _on_insert_clicked(self):
-        """Handle insert button click."""
-        try:
-            value = int(self.insert_input.text())
-            self.insert_requested.emit(value)
-            self.insert_input.clear()
-        except ValueError:
-            self.insert_input.setStyleSheet("border: 2px solid red;")
-    
-    def _create_delete_section(self) -> QGroupBox:
-        """Create the delete node section."""
-        group = QGroupBox("🗑️ Delete Node")
-        layout = QVBoxLayout()
-        layout.setSpacing(10)
+    def _build_section(self, key: str):
+        """
+        Fill a lazy section, unless that was already done.
         
-        # Input field
-        input_label = QLabel("Node Value:")
-        input_label.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        self.delete_input = QLineEdit()
-        self.delete_input.setPlaceholderText("Enter value to delete")
-        self.delete_input.setValidator(
-            QIntValidator(MIN_NODE_VALUE, MAX_NODE_VALUE)
-        )
-        self.delete_input.setMinimumHeight(40)
-        self.delete_input.setFont(QFont("Segoe UI", 11))
-        self.delete_input.returnPressed.connect(self._on_delete_clicked)
-        self.delete_input.setToolTip("Enter the value of node to delete")
+        Args:
+            key: Section key
+        """
+        if key in self._built_sections:
+            return
+        self._built_sections.add(key)
+        self._section_builders[key](self._section_groups[key].layout())
+    
+    def showEvent(self, event):
+        """Fill the lazy sections before the panel is first painted."""
+        for key in self._section_builders:
+            self._build_section(key)
+        super().showEvent(event)
+        # The panel was sized while those sections were still empty
+        self._check_fit()
+    
+    @staticmethod
+    def _set_invalid(line_edit: QLineEdit, invalid: bool):
+        """
+        Mark or unmark an input as invalid (red border from the theme stylesheet).
         
-        layout.addWidget(input_label)
-        layout.addWidget(self.delete_input)
+        Args:
+            line_edit: Input field
+            invalid: True to show the invalid border
+        """
+        if bool(line_edit.property("invalid")) == invalid:
+            return
+        line_edit.setProperty("invalid", invalid)
+        # Property selectors are only re-evaluated when the widget is polished
+        style = line_edit.style()
+        style.unpolish(line_edit)
+        style.polish(line_edit)
+    
+    def _read_value(self, line_edit: QLineEdit) -> Optional[int]:
+        """
+        Parse an input field, flagging it as invalid when it is not a value.
         
-        # Delete button
-        self.delete_btn = QPushButton("✕ Delete Node")
-        self.delete_btn.setObjectName("dangerButton")
-        self.delete_btn.setMinimumHeight(45)
-        self.delete_btn.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        self.delete_btn.clicked.connect(self._on_delete_clicked)
-        self.delete_btn.setToolTip("Click to delete the node from the BST")
-        layout.addWidget(self.delete_btn)
+        The validator accepts the locale's group separators ("1,000"), so the
+        text is parsed with the validator's locale rather than ``int()``.
         
-        group.setLayout(layout)
-        return group
-    
-    def _on_delete_clicked(self):
-        """Handle delete button click."""
-        try:
-            value = int(self.delete_input.text())
-            self.delete_requested.emit(value)
-            self.delete_input.clear()
-        except ValueError:
-            self.delete_input.setStyleSheet("border: 2px solid red;")
+        Args:
+            line_edit: Input field
+            
+        Returns:
+            The entered value, or None if the input is not acceptable
+        """
+        if line_edit.hasAcceptableInput():
+            value, ok = line_edit.validator().locale().toInt(line_edit.text())
+            if ok:
+                return value
+        self._set_invalid(line_edit, True)
+        return None
     
-    def _create_search_section(self) -> QGroupBox:
-        """Create the search node section."""
-        group = QGroupBox("🔍 Search Node")
+    def _create_value_section(
+        self,
+        name: str,
+        title: str,
+        placeholder: str,
+        input_tooltip: str,
+        button_text: str,
+        button_object_name: Optional[str],
+        button_tooltip: str
+    ) -> QGroupBox:
+        """
+        Create a section with a value input and an action button.
+        
+        Args:
+            name: Section name; the widgets are stored as <name>_input and
+                <name>_btn and both trigger _on_<name>_clicked
+            title: Group box title
+            placeholder: Input placeholder text
+            input_tooltip: Input tooltip
+            button_text: Button label
+            button_object_name: Object name for button styling, if any
+            button_tooltip: Button tooltip
+            
+        Returns:
+            The section's group box
+        """
+        group = QGroupBox(title)
         layout = QVBoxLayout()
         layout.setSpacing(10)
+        on_clicked = getattr(self, f"_on_{name}_clicked")
         
         # Input field
         input_label = QLabel("Node Value:")
-        input_label.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        self.search_input = QLineEdit()
-        self.search_input.setPlaceholderText("Enter value to search")
-        self.search_input.setValidator(
-            QIntValidator(MIN_NODE_VALUE, MAX_NODE_VALUE)
-        )
-        self.search_input.setMinimumHeight(40)
-        self.search_input.setFont(QFont("Segoe UI", 11))
-        self.search_input.returnPressed.connect(self._on_search_clicked)
-        self.search_input.setToolTip("Enter the value to search for in the tree")
+        input_label.setFont(self._bold_11)
+        line_edit = QLineEdit()
+        line_edit.setPlaceholderText(placeholder)
+        line_edit.setValidator(self._int_validator)
+        line_edit.setMinimumHeight(40)
+        line_edit.setFont(self._reg_11)
+        line_edit.returnPressed.connect(on_clicked)
+        line_edit.textChanged.connect(lambda: self._set_invalid(line_edit, False))
+        line_edit.setToolTip(input_tooltip)
+        setattr(self, f"{name}_input", line_edit)
         
         layout.addWidget(input_label)
-        layout.addWidget(self.search_input)
-        
-        # Search button
-        self.search_btn = QPushButton("🔎 Search")
-        self.search_btn.setMinimumHeight(45)
-        self.search_btn.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        self.search_btn.clicked.connect(self._on_search_clicked)
-        self.search_btn.setToolTip("Click to search for the value in the tree")
-        layout.addWidget(self.search_btn)
+        layout.addWidget(line_edit)
+        
+        # Action button
+        button = QPushButton(button_text)
+        if button_object_name:
+            button.setObjectName(button_object_name)
+        button.setFont(self._bold_11)
+        button.setMinimumHeight(45)
+        button.setToolTip(button_tooltip)
+        button.clicked.connect(on_clicked)
+        setattr(self, f"{name}_btn", button)
+        layout.addWidget(button)
         
         group.setLayout(layout)
         return group
     
+    def _on_insert_clicked(self):
+        """Handle insert button click."""
+        line_edit = self.insert_input
+        value = self._read_value(line_edit)
+        if value is None:
+            return
+        self.insert_requested.emit(value)
+        line_edit.clear()
+    
+    def _on_delete_clicked(self):
+        """Handle delete button click."""
+        line_edit = self.delete_input
+        value = self._read_value(line_edit)
+        if value is None:
+            return
+        self.delete_requested.emit(value)
+        line_edit.clear()
+    
     def _on_search_clicked(self):
         """Handle search button click."""
-        try:
-            value = int(self.search_input.text())
-            self.search_requested.emit(value)
-        except ValueError:
-            self.search_input.setStyleSheet("border: 2px solid red;")
+        line_edit = self.search_input
+        value = self._read_value(line_edit)
+        if value is None:
+            return
+        self.search_requested.emit(value)
     
-    def _create_traversal_section(self) -> QGroupBox:
-        """Create the traversal section."""
-        group = QGroupBox("🔄 Tree Traversal")
-        layout = QVBoxLayout()
+    def _build_traversal_section(self, layout: QVBoxLayout):
+        """Fill the traversal section."""
         layout.setSpacing(10)
         
         # Traversal type selector
         traversal_label = QLabel("Select Type:")
-        traversal_label.setFont(QFont("Segoe UI", 11, QFont.Bold))
+        traversal_label.setFont(self._bold_11)
         self.traversal_combo = QComboBox()
-        self.traversal_combo.addItems([
-            "Inorder (Left→Root→Right)", 
-            "Preorder (Root→Left→Right)", 
-            "Postorder (Left→Right→Root)", 
-            "Level-order (Breadth-First)"
-        ])
+        # Each item carries the traversal type it requests as user data
+        for label, traversal_type in [
+            ("Inorder (Left→Root→Right)", TRAVERSAL_INORDER),
+            ("Preorder (Root→Left→Right)", TRAVERSAL_PREORDER),
+            ("Postorder (Left→Right→Root)", TRAVERSAL_POSTORDER),
+            ("Level-order (Breadth-First)", TRAVERSAL_LEVELORDER),
+        ]:
+            self.traversal_combo.addItem(label, traversal_type)
         self.traversal_combo.setMinimumHeight(40)
-        self.traversal_combo.setFont(QFont("Segoe UI", 10))
+        self.traversal_combo.setFont(self._reg_10)
         
         layout.addWidget(traversal_label)
         layout.addWidget(self.traversal_combo)
@@ -245,55 +328,39 @@ class ControlPanel(QWidget):
         # Animate checkbox
         self.animate_traversal_check = QCheckBox("🎬 Animate Steps")
         self.animate_traversal_check.setChecked(True)
-        self.animate_traversal_check.setFont(QFont("Segoe UI", 10))
+        self.animate_traversal_check.setFont(self._reg_10)
         self.animate_traversal_check.setToolTip("Enable step-by-step animation of traversal")
         layout.addWidget(self.animate_traversal_check)
         
         # Traversal button
         self.traversal_btn = QPushButton("▶ Execute Traversal")
+        self.traversal_btn.setFont(self._bold_11)
         self.traversal_btn.setMinimumHeight(45)
-        self.traversal_btn.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        self.traversal_btn.clicked.connect(self._on_traversal_clicked)
         self.traversal_btn.setToolTip("Click to execute the selected traversal")
+        self.traversal_btn.clicked.connect(self._on_traversal_clicked)
         layout.addWidget(self.traversal_btn)
-        
-        group.setLayout(layout)
-        return group
     
     def _on_traversal_clicked(self):
         """Handle traversal button click."""
-        combo_text = self.traversal_combo.currentText().lower()
-        
-        # Extract traversal type from combo text
-        if "inorder" in combo_text:
-            traversal_type = "inorder"
-        elif "preorder" in combo_text:
-            traversal_type = "preorder"
-        elif "postorder" in combo_text:
-            traversal_type = "postorder"
-        elif "level-order" in combo_text or "breadth" in combo_text:
-            traversal_type = "level-order"
-        else:
-            traversal_type = "inorder"  # Default
-        
+        # Item data comes back from Qt as a new str; intern it to hand out
+        # the shared constant object again
+        traversal_type = sys.intern(self.traversal_combo.currentData() or TRAVERSAL_INORDER)
         self.traversal_requested.emit(traversal_type)
     
-    def _create_tree_generation_section(self) -> QGroupBox:
-        """Create the random tree generation section."""
-        group = QGroupBox("🎲 Generate Random Tree")
-        layout = QVBoxLayout()
+    def _build_tree_generation_section(self, layout: QVBoxLayout):
+        """Fill the random tree generation section."""
         layout.setSpacing(10)
         
         # Number of nodes
         count_label = QLabel("Number of Nodes:")
-        count_label.setFont(QFont("Segoe UI", 11, QFont.Bold))
+        count_label.setFont(self._bold_11)
         count_layout = QHBoxLayout()
         self.random_count_spin = QSpinBox()
         self.random_count_spin.setMinimum(1)
         self.random_count_spin.setMaximum(50)
         self.random_count_spin.setValue(15)
         self.random_count_spin.setMinimumHeight(40)
-        self.random_count_spin.setFont(QFont("Segoe UI", 11))
+        self.random_count_spin.setFont(self._reg_11)
         count_layout.addWidget(self.random_count_spin)
         count_layout.addStretch()
         
@@ -302,14 +369,11 @@ class ControlPanel(QWidget):
         
         # Generate button
         self.random_tree_btn = QPushButton("🎯 Generate Random Tree")
+        self.random_tree_btn.setFont(self._bold_11)
         self.random_tree_btn.setMinimumHeight(45)
-        self.random_tree_btn.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        self.random_tree_btn.clicked.connect(self._on_random_tree_clicked)
         self.random_tree_btn.setToolTip("Generate a random BST with unique values")
+        self.random_tree_btn.clicked.connect(self._on_random_tree_clicked)
         layout.addWidget(self.random_tree_btn)
-        
-        group.setLayout(layout)
-        return group
     
     def _on_random_tree_clicked(self):
         """Handle random tree generation."""
@@ -326,15 +390,15 @@ class ControlPanel(QWidget):
         undo_redo_layout = QHBoxLayout()
         undo_redo_layout.setSpacing(8)
         self.undo_btn = QPushButton("↶ Undo")
+        self.undo_btn.setFont(self._bold_11)
         self.undo_btn.setMinimumHeight(45)
-        self.undo_btn.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        self.undo_btn.clicked.connect(self._on_undo_clicked)
         self.undo_btn.setToolTip("Undo last operation")
+        self.undo_btn.clicked.connect(self._on_undo_clicked)
         self.redo_btn = QPushButton("↷ Redo")
+        self.redo_btn.setFont(self._bold_11)
         self.redo_btn.setMinimumHeight(45)
-        self.redo_btn.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        self.redo_btn.clicked.connect(self._on_redo_clicked)
         self.redo_btn.setToolTip("Redo last undone operation")
+        self.redo_btn.clicked.connect(self._on_redo_clicked)
         undo_redo_layout.addWidget(self.undo_btn)
         undo_redo_layout.addWidget(self.redo_btn)
         layout.addLayout(undo_redo_layout)
@@ -342,10 +406,10 @@ class ControlPanel(QWidget):
         # Reset button
         self.reset_btn = QPushButton("🗑️ Clear Tree")
         self.reset_btn.setObjectName("dangerButton")
+        self.reset_btn.setFont(self._bold_11)
         self.reset_btn.setMinimumHeight(45)
-        self.reset_btn.setFont(QFont("Segoe UI", 11, QFont.Bold))
-        self.reset_btn.clicked.connect(self._on_reset_clicked)
         self.reset_btn.setToolTip("Clear all nodes from the tree")
+        self.reset_btn.clicked.connect(self._on_reset_clicked)
         layout.addWidget(self.reset_btn)
         
         group.setLayout(layout)
@@ -371,7 +435,7 @@ class ControlPanel(QWidget):
         
         # Theme toggle
         self.theme_check = QCheckBox("🌙 Dark Mode")
-        self.theme_check.setFont(QFont("Segoe UI", 10))
+        self.theme_check.setFont(self._reg_10)
         self.theme_check.setToolTip("Toggle between light and dark themes")
         self.theme_check.toggled.connect(self._on_theme_toggled)
         layout.addWidget(self.theme_check)
@@ -383,23 +447,21 @@ class ControlPanel(QWidget):
         """Handle theme toggle."""
         self.theme_toggled.emit(checked)
     
-    def _create_output_section(self) -> QGroupBox:
-        """Create the output display section."""
-        group = QGroupBox("📊 Traversal Output")
-        layout = QVBoxLayout()
+    def _build_output_section(self, layout: QVBoxLayout):
+        """Fill the output display section."""
         layout.setSpacing(8)
         
         # Output text display
-        self.output_display = QTextEdit()
+        # Plain text skips the rich text parser, and the block limit keeps
+        # the document from growing across traversals
+        self.output_display = QPlainTextEdit()
         self.output_display.setReadOnly(True)
+        self.output_display.setMaximumBlockCount(200)
         self.output_display.setMaximumHeight(120)
-        self.output_display.setFont(QFont("Courier New", 10))
+        self.output_display.setFont(self._mono_10)
         self.output_display.setPlaceholderText("Traversal results will appear here...")
         
         layout.addWidget(self.output_display)
-        
-        group.setLayout(layout)
-        return group
     
     def set_output(self, text: str):
         """
@@ -408,7 +470,29 @@ class ControlPanel(QWidget):
         Args:
             text: Text to display
         """
-        self.output_display.setText(text)
+        self._build_section("output")
+        if text != self._last_output:
+            self._last_output = text
+            self.output_display.setPlainText(text)
+    
+    def is_traversal_animated(self) -> bool:
+        """Return True if traversals should be animated step by step."""
+        # The checkbox defaults to checked, so an unbuilt section means yes
+        if "traversal" not in self._built_sections:
+            return True
+        return self.animate_traversal_check.isChecked()
+    
+    def set_dark_mode(self, dark: bool):
+        """
+        Check or uncheck the dark mode box without emitting theme_toggled.
+        Use this for programmatic changes so theme_toggled only reports
+        real user clicks.
+        
+        Args:
+            dark: True to check the box
+        """
+        with QSignalBlocker(self.theme_check):
+            self.theme_check.setChecked(dark)
     
     def enable_undo(self, enabled: bool):
         """Enable/disable undo button."""
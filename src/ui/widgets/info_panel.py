@@ -1,9 +1,14 @@
 """Information panel for displaying tree statistics."""
-from PyQt5.QtWidgets import QWidget, QVBoxLayout, QGroupBox, QLabel, QHBoxLayout, QScrollArea
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QGroupBox, QLabel, QHBoxLayout
+from PyQt5.QtCore import QTimer
 from PyQt5.QtGui import QFont
+from typing import Optional
 
+from src.config import MESSAGE_THROTTLE_INTERVAL
+from .side_panel import SidePanel
 
-class InfoPanel(QWidget):
+
+class InfoPanel(SidePanel):
     """
     Displays information about the current tree state.
     Shows size, height, balance status, etc.
@@ -12,15 +17,22 @@ class InfoPanel(QWidget):
     def __init__(self, parent=None):
         """Initialize the info panel."""
         super().__init__(parent)
+        
+        # Status text arriving faster than the throttle interval waits here
+        # and only the latest message is shown when the interval ends
+        self._pending_message: Optional[str] = None
+        self._message_timer = QTimer(self)
+        self._message_timer.setSingleShot(True)
+        self._message_timer.setInterval(MESSAGE_THROTTLE_INTERVAL)
+        self._message_timer.timeout.connect(self._flush_message)
+        
+        # (size, height, is_balanced) currently shown, None if not known
+        self._last_tree_info = None
+        
         self.init_ui()
     
     def init_ui(self):
         """Initialize the user interface."""
-        # Use scroll area for responsive design
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setStyleSheet("QScrollArea { border: none; }")
-        
         scroll_content = QWidget()
         layout = QVBoxLayout()
         layout.setSpacing(10)
@@ -80,12 +92,9 @@ class InfoPanel(QWidget):
         layout.addStretch()
         
         scroll_content.setLayout(layout)
-        scroll.setWidget(scroll_content)
         
-        main_layout = QVBoxLayout()
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.addWidget(scroll)
-        self.setLayout(main_layout)
+        # Scrolls only once the panel is too short for its contents
+        self.set_body(scroll_content, "QScrollArea { border: none; }")
     
     def update_tree_info(self, size: int, height: int, is_balanced: bool):
         """
@@ -96,11 +105,25 @@ class InfoPanel(QWidget):
             height: Height of tree
             is_balanced: Whether tree is balanced
         """
-        self.size_label.setText(f"Nodes: {size}")
-        self.height_label.setText(f"Height: {height}")
-        
-        balance_text = "Yes" if is_balanced else "No"
-        self.balance_label.setText(f"Balanced: {balance_text}")
+        tree_info = (size, height, is_balanced)
+        last = self._last_tree_info
+        if tree_info == last:
+            return
+        if last is None:
+            last = (None, None, None)
+        
+        # Only touch the labels that changed, and repaint once for all of them
+        self.setUpdatesEnabled(False)
+        try:
+            if size != last[0]:
+                self.size_label.setText(f"Nodes: {size}")
+            if height != last[1]:
+                self.height_label.setText(f"Height: {height}")
+            if is_balanced != last[2]:
+                self.balance_label.setText("Balanced: Yes" if is_balanced else "Balanced: No")
+        finally:
+            self.setUpdatesEnabled(True)
+        self._last_tree_info = tree_info
     
     def set_last_operation(self, text: str):
         """
@@ -109,21 +132,41 @@ class InfoPanel(QWidget):
         Args:
             text: Operation description
         """
-        self.operation_label.setText(text)
+        if text != self.operation_label.text():
+            self.operation_label.setText(text)
     
     def set_message(self, text: str):
         """
         Set a message in the info panel.
+        Shown immediately unless another message was shown within the
+        throttle interval, in which case the latest one is shown when the
+        interval ends.
         
         Args:
             text: Message to display
         """
+        if self._message_timer.isActive():
+            self._pending_message = text
+            return
+        if text == self.message_label.text():
+            return
         self.message_label.setText(text)
+        self._message_timer.start()
+    
+    def _flush_message(self):
+        """Show the message held back by the throttle, if any."""
+        if self._pending_message is not None:
+            text = self._pending_message
+            self._pending_message = None
+            self.message_label.setText(text)
+            self._message_timer.start()
     
     def clear(self):
         """Clear all information."""
         self.size_label.setText("Nodes: 0")
         self.height_label.setText("Height: -1")
         self.balance_label.setText("Balanced: -")
+        self._last_tree_info = None
         self.operation_label.setText("None")
+        self._pending_message = None
         self.message_label.setText("Tree cleared")
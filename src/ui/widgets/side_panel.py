@@ -0,0 +1,60 @@
+"""Base widget for the scrollable side panels."""
+from PyQt5.QtWidgets import QWidget, QVBoxLayout, QScrollArea, QSizePolicy
+from typing import Optional
+
+
+class SidePanel(QWidget):
+    """
+    Side panel that shows its body directly and only wraps it in a
+    QScrollArea the first time the body no longer fits.
+    """
+    
+    def __init__(self, parent=None):
+        """Initialize the side panel."""
+        super().__init__(parent)
+        self._body: Optional[QWidget] = None
+        self._scroll: Optional[QScrollArea] = None
+        self._scroll_style = ""
+    
+    def set_body(self, body: QWidget, scroll_style: str = ""):
+        """
+        Set the panel contents.
+        
+        Args:
+            body: Widget holding the panel contents
+            scroll_style: Stylesheet for the scroll area, once one is needed
+        """
+        self._body = body
+        self._scroll_style = scroll_style
+        # Let the panel shrink below the body; resizeEvent adds scrolling then
+        body.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Ignored)
+        
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(0, 0, 0, 0)
+        main_layout.addWidget(body)
+        self.setLayout(main_layout)
+    
+    def resizeEvent(self, event):
+        """Wrap the body in a scroll area once it stops fitting."""
+        super().resizeEvent(event)
+        self._check_fit()
+    
+    def _check_fit(self):
+        """Install the scroll area if the body is taller than the panel."""
+        body = self._body
+        if self._scroll is None and body is not None:
+            if body.minimumSizeHint().height() > self.height():
+                self._install_scroll_area()
+    
+    def _install_scroll_area(self):
+        """Move the body into a scroll area (done at most once)."""
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setStyleSheet(self._scroll_style)
+        
+        layout = self.layout()
+        layout.removeWidget(self._body)
+        self._body.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Preferred)
+        scroll.setWidget(self._body)
+        layout.addWidget(scroll)
+        self._scroll = scroll
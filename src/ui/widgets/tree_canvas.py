@@ -1,18 +1,23 @@
 """Tree visualization canvas using PyQt5."""
-from PyQt5.QtWidgets import QGraphicsView, QGraphicsScene
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QSize
-from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont, QFontMetrics
-from typing import Optional, List, Set
-from src.models import Node, BinarySearchTree
+import heapq
+import time
+from array import array
+from PyQt5.QtWidgets import (
+    QGraphicsView, QGraphicsScene, QGraphicsItem, QGraphicsEllipseItem,
+    QGraphicsTextItem, QGraphicsLineItem
+)
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QPainter, QPen, QBrush, QColor, QFont
+from typing import Optional, List, Set, Dict, Tuple, Iterable
+from src.models import BinarySearchTree
 from src.config import (
     NODE_RADIUS, NODE_COLOR_DEFAULT_LIGHT, NODE_COLOR_HIGHLIGHTED,
     NODE_COLOR_SEARCHING, NODE_BORDER_WIDTH, NODE_BORDER_COLOR,
-    EDGE_COLOR_LIGHT, EDGE_COLOR_DARK, EDGE_WIDTH, ANIMATION_STEPS,
-    VERTICAL_GAP, HORIZONTAL_GAP, TOP_MARGIN, NODE_LABEL_FONT_SIZE,
+    EDGE_COLOR_LIGHT, EDGE_COLOR_DARK, EDGE_WIDTH, NODE_LABEL_FONT_SIZE,
     CANVAS_BACKGROUND_LIGHT, CANVAS_BACKGROUND_DARK, TEXT_COLOR_LIGHT,
-    TEXT_COLOR_DARK, ANIMATION_DURATION
+    TEXT_COLOR_DARK, FULL_VIEWPORT_UPDATE_MIN_NODES
 )
-from src.utils import AnimationEngine, TransitionAnimation
+from src.utils import AnimationEngine
 
 
 class TreeCanvas(QGraphicsView):
@@ -32,6 +37,9 @@ class TreeCanvas(QGraphicsView):
         
         # Scene setup with responsive sizing
         self.scene = QGraphicsScene()
+        # Items are recolored and moved often and a tree has at most a few
+        # thousand of them, so a BSP index costs more to maintain than it saves
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
         self.setScene(self.scene)
         self.setStyleSheet(f"QGraphicsView{{ border: 2px solid #bdc3c7; background: white; }}")
         
@@ -42,6 +50,8 @@ class TreeCanvas(QGraphicsView):
         # Tree data
         self.tree: Optional[BinarySearchTree] = None
         self.dark_mode = False
+        # Background has not been applied yet, so the first call always runs
+        self._applied_dark: Optional[bool] = None
         
         # Animation
         self.animation_engine = AnimationEngine()
@@ -50,7 +60,6 @@ class TreeCanvas(QGraphicsView):
         self.last_animation_time = 0
         
         # Rendering properties
-        self.node_positions = {}  # Cache for node positions
         self.highlighted_nodes: Set[int] = set()
         self.searching_nodes: Set[int] = set()
         self.traversal_path: List[int] = []
@@ -59,6 +68,66 @@ class TreeCanvas(QGraphicsView):
         # Node animation states
         self.node_animations = {}
         
+        # Scene items are kept between redraws, keyed by node value (values
+        # are unique and survive undo restores, unlike the Node objects).
+        # Structural changes move, add or remove items; highlight changes
+        # only recolor the affected node circles
+        self._node_items: Dict[int, QGraphicsEllipseItem] = {}
+        self._label_items: Dict[int, QGraphicsTextItem] = {}
+        # Half width and height of each label, measured once on creation
+        self._label_half_sizes: Dict[int, Tuple[float, float]] = {}
+        self._edge_items: Dict[Tuple[int, int], QGraphicsLineItem] = {}
+        self._node_colors: Dict[int, str] = {}
+        # Tree version the items were last built from; None forces a rebuild
+        self._built_version: Optional[int] = None
+        # The view transform only needs refitting after the items moved or
+        # the viewport was resized, not after a recolor
+        self._view_dirty = True
+        
+        # Drawn node centers as parallel arrays (value, x, y), refilled in
+        # preorder on every rebuild; click hit-testing scans these instead
+        # of walking the tree's Node objects
+        self._node_values = array('i')
+        self._xs = array('d')
+        self._ys = array('d')
+        
+        # Drawing resources shared by every item; the theme-dependent edge
+        # pen and text color are rebuilt in set_dark_mode()
+        self._node_font = QFont("Segoe UI", NODE_LABEL_FONT_SIZE, QFont.Bold)
+        self._border_pen = QPen(QColor(NODE_BORDER_COLOR), NODE_BORDER_WIDTH)
+        self._brushes: Dict[str, QBrush] = {
+            color: QBrush(QColor(color))
+            for color in (NODE_COLOR_DEFAULT_LIGHT, NODE_COLOR_HIGHLIGHTED, NODE_COLOR_SEARCHING)
+        }
+        self._edge_pen = QPen(QColor(EDGE_COLOR_LIGHT), EDGE_WIDTH)
+        self._text_color = QColor(TEXT_COLOR_LIGHT)
+        
+        # Empty-tree message, created once. It is only in the scene while the
+        # tree is empty, since hidden items still count towards the bounding
+        # rect the view is fitted to
+        self._message_item = self._create_empty_tree_message()
+        
+        # Pending highlight expiries as a heap of (deadline, value), with
+        # deadlines in time.monotonic() seconds. One single-shot timer is
+        # re-armed for the earliest deadline instead of a timer per highlight
+        self._highlight_deadlines: List[Tuple[float, int]] = []
+        self._highlight_timer = QTimer(self)
+        self._highlight_timer.setSingleShot(True)
+        self._highlight_timer.timeout.connect(self._expire_highlights)
+        
+        # Nesting depth of _begin_batch()/_end_batch() pairs
+        self._batch_depth = 0
+        
+        # Highlight and theme changes only mark what needs refreshing and
+        # start a zero-delay timer, so a burst of them within one event loop
+        # turn is applied in a single refresh
+        self._pending_values: Set[int] = set()
+        self._pending_all = False
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(0)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        
         # Step-by-step traversal
         self.step_mode = False
         self.step_timer = QTimer()
@@ -73,15 +142,18 @@ class TreeCanvas(QGraphicsView):
         self.setMouseTracking(True)
         self.hovered_node = None
     
-    def set_tree(self, tree: BinarySearchTree):
+    def set_tree(self, tree: BinarySearchTree, redraw: bool = True):
         """
         Set the tree to visualize.
         
         Args:
             tree: BinarySearchTree instance to visualize
+            redraw: False to leave the redraw to the caller
         """
         self.tree = tree
-        self.redraw()
+        self._built_version = None
+        if redraw:
+            self.redraw()
     
     def set_dark_mode(self, dark: bool):
         """
@@ -90,150 +162,306 @@ class TreeCanvas(QGraphicsView):
         Args:
             dark: True for dark theme, False for light theme
         """
+        if dark == self._applied_dark:
+            return
+        self._applied_dark = dark
         self.dark_mode = dark
         bg_color = CANVAS_BACKGROUND_DARK if dark else CANVAS_BACKGROUND_LIGHT
         self.scene.setBackgroundBrush(QBrush(QColor(bg_color)))
-        self.redraw()
+        
+        # Recolor the existing edges and labels in place
+        edge_pen = QPen(QColor(EDGE_COLOR_DARK if dark else EDGE_COLOR_LIGHT), EDGE_WIDTH)
+        self._edge_pen = edge_pen
+        for line in self._edge_items.values():
+            line.setPen(edge_pen)
+        text_color = QColor(TEXT_COLOR_DARK if dark else TEXT_COLOR_LIGHT)
+        self._text_color = text_color
+        for text_item in self._label_items.values():
+            text_item.setDefaultTextColor(text_color)
+        self._message_item.setDefaultTextColor(text_color)
+        
+        self._request_refresh()
     
     def redraw(self):
-        """Clear and redraw the entire tree."""
-        self.scene.clear()
-        self.node_positions.clear()
-        
-        if self.tree is None or self.tree.is_empty():
-            self._draw_empty_tree_message()
-            return
-        
-        # Calculate node positions
-        self._calculate_positions(self.tree.root, 0, 0)
+        """Bring the scene up to date with the tree and fit it in view."""
+        # Covers anything a pending refresh would have done
+        self._refresh_timer.stop()
+        self._pending_values.clear()
+        self._pending_all = False
+        
+        self._update_scene()
+        if self._view_dirty:
+            self._fit_view()
+    
+    def _request_refresh(self, changed: Optional[Iterable[int]] = None):
+        """
+        Schedule a refresh for the next event loop turn.
         
-        # Draw edges
-        self._draw_edges(self.tree.root)
+        Args:
+            changed: Values whose highlight state changed, None for all
+        """
+        if changed is None:
+            self._pending_all = True
+        else:
+            self._pending_values.update(changed)
+        self._refresh_timer.start()
+    
+    def _do_refresh(self):
+        """Apply every change requested since the last refresh in one repaint."""
+        changed = None if self._pending_all else self._pending_values
+        self._pending_values = set()
+        self._pending_all = False
+        
+        self._begin_batch()
+        try:
+            self._update_scene(changed)
+            if self._view_dirty:
+                self._fit_view()
+        finally:
+            self._end_batch()
+    
+    def resizeEvent(self, event):
+        """Refit the tree on the next redraw after the viewport is resized."""
+        super().resizeEvent(event)
+        self._view_dirty = True
+    
+    def _update_scene(self, changed: Optional[Iterable[int]] = None) -> bool:
+        """
+        Bring the scene up to date with the tree and highlight state.
         
-        # Draw nodes
-        self._draw_nodes(self.tree.root)
+        Args:
+            changed: Values whose highlight state changed, None for all
+            
+        Returns:
+            True if the scene items were rebuilt, False if only recolored
+        """
+        if self.tree is None or self.tree.is_empty():
+            if self._message_item.scene() is not None:
+                # Already showing the message and nothing else
+                return False
+            self.scene.clear()
+            self._node_items = {}
+            self._label_items = {}
+            self._label_half_sizes = {}
+            self._edge_items = {}
+            self._node_colors = {}
+            self._node_values = array('i')
+            self._xs = array('d')
+            self._ys = array('d')
+            self._built_version = None
+            self._view_dirty = True
+            self.scene.addItem(self._message_item)
+            return True
+        
+        # The items only need updating after the tree's shape changed. The
+        # version is compared rather than layout()'s return value, which is
+        # only True for the first caller after a change
+        if self.tree.version != self._built_version:
+            self.tree.layout()
+            self._build_scene()
+            return True
+        
+        self._refresh_colors(changed)
+        return False
+    
+    def _build_scene(self):
+        """Create, move or remove items so the scene matches the tree."""
+        if self._message_item.scene() is not None:
+            self.scene.removeItem(self._message_item)
+        
+        # Nodes present before this update that are not seen again are stale
+        stale_nodes = set(self._node_items)
+        stale_edges = set(self._edge_items)
+        
+        # Draw nodes, labels and edges
+        self._draw_tree(stale_nodes, stale_edges)
+        
+        for edge in stale_edges:
+            self.scene.removeItem(self._edge_items.pop(edge))
+        for value in stale_nodes:
+            self.scene.removeItem(self._node_items.pop(value))
+            self.scene.removeItem(self._label_items.pop(value))
+            del self._label_half_sizes[value]
+            del self._node_colors[value]
+        
+        # Large trees change many small items per step, where working out
+        # the dirty region costs more than repainting everything
+        if len(self._node_items) > FULL_VIEWPORT_UPDATE_MIN_NODES:
+            update_mode = QGraphicsView.FullViewportUpdate
+        else:
+            update_mode = QGraphicsView.MinimalViewportUpdate
+        if self.viewportUpdateMode() != update_mode:
+            self.setViewportUpdateMode(update_mode)
         
-        # Fit entire tree in view with padding
+        self._built_version = self.tree.version
+        self._view_dirty = True
+    
+    def _fit_view(self):
+        """Fit the entire tree in view with padding."""
         if self.scene.itemsBoundingRect().isValid():
             self.fitInView(self.scene.itemsBoundingRect(), Qt.KeepAspectRatio)
             # Add padding by scaling down slightly
             self.scale(0.85, 0.85)
+        self._view_dirty = False
     
-    def _calculate_positions(self, node: Optional[Node], x: float, y: float, offset: float = 100):
+    def _color_lookup(self) -> Dict[int, str]:
         """
-        Calculate positions for nodes in the tree (recursive).
-        Uses a space-filling algorithm to prevent overlap.
-        
-        Args:
-            node: Current node
-            x: X position for this node
-            y: Y position for this node
-            offset: Horizontal spacing offset
+        Map every highlighted or searched value to its fill color.
+        Highlighting wins over searching; values not in the map use
+        NODE_COLOR_DEFAULT_LIGHT.
         """
-        if node is None:
-            return
-        
-        # Store position
-        self.node_positions[id(node)] = (x, y)
-        node.x, node.y = x, y
-        
-        # Calculate offset for subtrees
-        next_y = y + VERTICAL_GAP
-        next_offset = offset / 2
-        
-        if node.left:
-            left_x = x - offset
-            self._calculate_positions(node.left, left_x, next_y, next_offset)
-        
-        if node.right:
-            right_x = x + offset
-            self._calculate_positions(node.right, right_x, next_y, next_offset)
+        lookup = dict.fromkeys(self.searching_nodes, NODE_COLOR_SEARCHING)
+        lookup.update(dict.fromkeys(self.highlighted_nodes, NODE_COLOR_HIGHLIGHTED))
+        return lookup
     
-    def _draw_edges(self, node: Optional[Node]):
+    def _refresh_colors(self, values: Optional[Iterable[int]] = None):
         """
-        Draw edges connecting nodes (recursive).
+        Recolor the existing node items whose highlight state changed.
         
         Args:
-            node: Current node
+            values: Values to check, None to check every node
         """
-        if node is None:
-            return
-        
-        edge_color = EDGE_COLOR_DARK if self.dark_mode else EDGE_COLOR_LIGHT
-        pen = QPen(QColor(edge_color), EDGE_WIDTH)
-        
-        node_x, node_y = node.x, node.y
-        
-        if node.left:
-            left_x, left_y = node.left.x, node.left.y
-            self.scene.addLine(node_x, node_y, left_x, left_y, pen)
-            self._draw_edges(node.left)
-        
-        if node.right:
-            right_x, right_y = node.right.x, node.right.y
-            self.scene.addLine(node_x, node_y, right_x, right_y, pen)
-            self._draw_edges(node.right)
+        node_items = self._node_items
+        node_colors = self._node_colors
+        colors = self._color_lookup()
+        if values is None:
+            values = node_items
+        for value in values:
+            item = node_items.get(value)
+            if item is None:
+                continue
+            color = colors.get(value, NODE_COLOR_DEFAULT_LIGHT)
+            if node_colors[value] != color:
+                node_colors[value] = color
+                item.setBrush(self._brushes[color])
     
-    def _draw_nodes(self, node: Optional[Node]):
+    def _draw_tree(self, stale_nodes: Set[int], stale_edges: Set[Tuple[int, int]]):
         """
-        Draw node circles and labels (recursive).
+        Add or move every node circle, label and edge in one preorder walk.
+        
+        The walk uses an explicit stack rather than recursion, so deep
+        (skewed) trees cannot hit the interpreter's recursion limit.
         
         Args:
-            node: Current node
+            stale_nodes: Values not drawn yet; every node drawn is removed from it
+            stale_edges: Edges not drawn yet; every edge drawn is removed from it
         """
-        if node is None:
-            return
-        
-        # Determine node color
-        if node.value in self.highlighted_nodes:
-            color = NODE_COLOR_HIGHLIGHTED
-        elif node.value in self.searching_nodes:
-            color = NODE_COLOR_SEARCHING
-        else:
-            color = NODE_COLOR_DEFAULT_LIGHT
-        
-        # Draw circle
-        brush = QBrush(QColor(color))
-        pen = QPen(QColor(NODE_BORDER_COLOR), NODE_BORDER_WIDTH)
-        self.scene.addEllipse(
-            node.x - NODE_RADIUS,
-            node.y - NODE_RADIUS,
-            NODE_RADIUS * 2,
-            NODE_RADIUS * 2,
-            pen,
-            brush
-        )
-        
-        # Draw label
-        text_color = TEXT_COLOR_DARK if self.dark_mode else TEXT_COLOR_LIGHT
-        font = QFont("Segoe UI", NODE_LABEL_FONT_SIZE, QFont.Bold)
-        text_item = self.scene.addText(str(node.value), font)
-        text_item.setDefaultTextColor(QColor(text_color))
-        
-        # Center text on node
-        text_rect = text_item.boundingRect()
-        text_item.setPos(
-            node.x - text_rect.width() / 2,
-            node.y - text_rect.height() / 2
-        )
-        
-        # Recursively draw child nodes
-        self._draw_nodes(node.left)
-        self._draw_nodes(node.right)
+        scene = self.scene
+        node_items = self._node_items
+        label_items = self._label_items
+        label_half_sizes = self._label_half_sizes
+        edge_items = self._edge_items
+        node_colors = self._node_colors
+        brushes = self._brushes
+        edge_pen = self._edge_pen
+        colors = self._color_lookup()
+        
+        node_values = array('i')
+        xs = array('d')
+        ys = array('d')
+        
+        stack = [self.tree.root]
+        while stack:
+            node = stack.pop()
+            value = node.value
+            node_x, node_y = node.x, node.y
+            node_values.append(value)
+            xs.append(node_x)
+            ys.append(node_y)
+            
+            ellipse = node_items.get(value)
+            if ellipse is None:
+                # Determine node color
+                color = colors.get(value, NODE_COLOR_DEFAULT_LIGHT)
+                
+                # Draw circle
+                ellipse = scene.addEllipse(
+                    node_x - NODE_RADIUS,
+                    node_y - NODE_RADIUS,
+                    NODE_RADIUS * 2,
+                    NODE_RADIUS * 2,
+                    self._border_pen,
+                    brushes[color]
+                )
+                # Nodes stay above edges and labels above nodes, even when
+                # added after them
+                ellipse.setZValue(1)
+                node_items[value] = ellipse
+                node_colors[value] = color
+                
+                # Draw label
+                text_item = scene.addText(str(value), self._node_font)
+                text_item.setDefaultTextColor(self._text_color)
+                # Labels never change; repaint them from a cached pixmap
+                text_item.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+                text_item.setZValue(2)
+                label_items[value] = text_item
+                
+                # Center text on node; the text never changes, so its size
+                # is only measured here
+                text_rect = text_item.boundingRect()
+                half_width = text_rect.width() / 2
+                half_height = text_rect.height() / 2
+                label_half_sizes[value] = (half_width, half_height)
+                text_item.setPos(node_x - half_width, node_y - half_height)
+            else:
+                stale_nodes.discard(value)
+                rect = ellipse.rect()
+                if rect.x() != node_x - NODE_RADIUS or rect.y() != node_y - NODE_RADIUS:
+                    ellipse.setRect(
+                        node_x - NODE_RADIUS,
+                        node_y - NODE_RADIUS,
+                        NODE_RADIUS * 2,
+                        NODE_RADIUS * 2
+                    )
+                    half_width, half_height = label_half_sizes[value]
+                    label_items[value].setPos(node_x - half_width, node_y - half_height)
+                # The highlight state may have changed while the item was kept
+                color = colors.get(value, NODE_COLOR_DEFAULT_LIGHT)
+                if node_colors[value] != color:
+                    node_colors[value] = color
+                    ellipse.setBrush(brushes[color])
+            
+            # Edges to the children
+            for child in (node.left, node.right):
+                if child is None:
+                    continue
+                key = (value, child.value)
+                line = edge_items.get(key)
+                if line is None:
+                    line = scene.addLine(node_x, node_y, child.x, child.y, edge_pen)
+                    line.setCacheMode(QGraphicsItem.DeviceCoordinateCache)
+                    edge_items[key] = line
+                else:
+                    stale_edges.discard(key)
+                    current = line.line()
+                    if (current.x1() != node_x or current.y1() != node_y
+                            or current.x2() != child.x or current.y2() != child.y):
+                        line.setLine(node_x, node_y, child.x, child.y)
+            
+            # Right is pushed first so the left subtree is drawn first
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+        
+        self._node_values = node_values
+        self._xs = xs
+        self._ys = ys
     
-    def _draw_empty_tree_message(self):
-        """Draw a message when the tree is empty."""
-        text_color = TEXT_COLOR_DARK if self.dark_mode else TEXT_COLOR_LIGHT
-        font = QFont("Segoe UI", 14)
-        text_item = self.scene.addText("Tree is empty. Insert nodes to start!", font)
-        text_item.setDefaultTextColor(QColor(text_color))
+    def _create_empty_tree_message(self) -> QGraphicsTextItem:
+        """Create the message shown while the tree is empty."""
+        text_item = QGraphicsTextItem("Tree is empty. Insert nodes to start!")
+        text_item.setFont(QFont("Segoe UI", 14))
+        text_item.setDefaultTextColor(self._text_color)
         
         # Center the message
-        rect = self.scene.itemsBoundingRect()
+        rect = text_item.boundingRect()
         text_item.setPos(
             rect.x() + rect.width() / 2 - 150,
             rect.y() + rect.height() / 2 - 20
         )
+        return text_item
     
     def highlight_node(self, value: int, duration: int = 500):
         """
@@ -244,15 +472,34 @@ class TreeCanvas(QGraphicsView):
             duration: Duration of highlight in milliseconds
         """
         self.highlighted_nodes.add(value)
-        self.redraw()
+        self._request_refresh((value,))
         
         # Auto-unhighlight after duration
-        QTimer.singleShot(duration, lambda: self._unhighlight_node(value))
+        deadline = time.monotonic() + duration / 1000
+        heapq.heappush(self._highlight_deadlines, (deadline, value))
+        if self._highlight_deadlines[0][0] == deadline:
+            self._arm_highlight_timer()
     
-    def _unhighlight_node(self, value: int):
-        """Remove highlight from a node."""
-        self.highlighted_nodes.discard(value)
-        self.redraw()
+    def _arm_highlight_timer(self):
+        """Schedule the highlight timer for the earliest pending expiry."""
+        if self._highlight_deadlines:
+            remaining = self._highlight_deadlines[0][0] - time.monotonic()
+            self._highlight_timer.start(max(0, int(remaining * 1000 + 0.5)))
+        else:
+            self._highlight_timer.stop()
+    
+    def _expire_highlights(self):
+        """Remove the highlights whose duration has run out."""
+        deadlines = self._highlight_deadlines
+        now = time.monotonic()
+        expired = []
+        while deadlines and deadlines[0][0] <= now:
+            expired.append(heapq.heappop(deadlines)[1])
+        
+        if expired:
+            self.highlighted_nodes.difference_update(expired)
+            self._request_refresh(expired)
+        self._arm_highlight_timer()
     
     def show_search_path(self, path: List[int]):
         """
@@ -261,14 +508,33 @@ class TreeCanvas(QGraphicsView):
         Args:
             path: List of node values in search path
         """
+        changed = self.searching_nodes.symmetric_difference(path)
         self.searching_nodes = set(path)
-        self.redraw()
+        self._request_refresh(changed)
     
     def clear_search_path(self):
         """Clear the search path highlighting."""
+        changed = self.searching_nodes | self.highlighted_nodes
         self.searching_nodes.clear()
         self.highlighted_nodes.clear()
-        self.redraw()
+        self._highlight_deadlines.clear()
+        self._highlight_timer.stop()
+        self._request_refresh(changed)
+    
+    def _begin_batch(self):
+        """Hold back repaints while several items change; pairs with _end_batch()."""
+        self._batch_depth += 1
+        if self._batch_depth == 1:
+            self.setUpdatesEnabled(False)
+            self.scene.blockSignals(True)
+    
+    def _end_batch(self):
+        """Finish a batch started by _begin_batch() with a single repaint."""
+        self._batch_depth -= 1
+        if self._batch_depth == 0:
+            self.scene.blockSignals(False)
+            self.setUpdatesEnabled(True)
+            self.viewport().update()
     
     def animate_traversal(self, traversal_path: List[int], step_delay: int = 400):
         """
@@ -329,15 +595,20 @@ class TreeCanvas(QGraphicsView):
         """Handle mouse click events on nodes."""
         super().mousePressEvent(event)
         pos = self.mapToScene(event.pos())
-        
-        # Check if clicked on a node
-        items = self.scene.items(pos)
-        for item in items:
-            if hasattr(item, 'rect'):
-                # Try to find the node value
-                if self.tree:
-                    for node in self.tree.get_all_nodes():
-                        distance = ((node.x - pos.x())**2 + (node.y - pos.y())**2)**0.5
-                        if distance <= NODE_RADIUS:
-                            self.node_clicked.emit(node.value)
-                            return
+        px, py = pos.x(), pos.y()
+        
+        # Nearest node center within the radius; squared distances avoid
+        # the square root
+        best_index = -1
+        best_d2 = NODE_RADIUS * NODE_RADIUS
+        ys = self._ys
+        for i, x in enumerate(self._xs):
+            dx = x - px
+            dy = ys[i] - py
+            d2 = dx * dx + dy * dy
+            if d2 <= best_d2:
+                best_index = i
+                best_d2 = d2
+        
+        if best_index >= 0:
+            self.node_clicked.emit(self._node_values[best_index])
@@ -1,6 +1,6 @@
 """Utilities package for BST Visualizer."""
-from .history import OperationHistory, Operation
+from .history import OperationHistory, Operation, TreeOp
 from .animations import AnimationEngine, Animation, TransitionAnimation, AnimationType
 from .export import TreeExporter
 
-__all__ = ['OperationHistory', 'Operation', 'AnimationEngine', 'Animation', 'TransitionAnimation', 'AnimationType', 'TreeExporter']
+__all__ = ['OperationHistory', 'Operation', 'TreeOp', 'AnimationEngine', 'Animation', 'TransitionAnimation', 'AnimationType', 'TreeExporter']
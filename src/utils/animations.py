@@ -12,6 +12,38 @@ class AnimationType(Enum):
     EASE_IN_OUT = 4
 
 
+def _ease_linear(t: float) -> float:
+    """Constant speed."""
+    return t
+
+
+def _ease_in(t: float) -> float:
+    """Start slow and accelerate."""
+    return t * t
+
+
+def _ease_out(t: float) -> float:
+    """Start fast and decelerate."""
+    return t * (2 - t)
+
+
+def _ease_in_out(t: float) -> float:
+    """Accelerate through the first half and decelerate through the second."""
+    if t < 0.5:
+        return 2 * t * t
+    u = 2 - 2 * t
+    return 1 - u * u / 2
+
+
+# Easing function for each animation type, looked up once per animation
+_EASING_FUNCTIONS = {
+    AnimationType.LINEAR: _ease_linear,
+    AnimationType.EASE_IN: _ease_in,
+    AnimationType.EASE_OUT: _ease_out,
+    AnimationType.EASE_IN_OUT: _ease_in_out,
+}
+
+
 class AnimationEngine:
     """
     Manages animations for tree visualization.
@@ -59,17 +91,16 @@ class AnimationEngine:
             delta_time: Time elapsed since last update in milliseconds
         """
         self.elapsed_time += delta_time
-        completed_animations = []
         
+        # Collect the animations still in progress instead of removing the
+        # completed ones one list.remove() at a time
+        survivors = []
         for animation in self.animations:
             if animation.is_running:
                 animation.update(delta_time)
-                if animation.is_complete:
-                    completed_animations.append(animation)
-        
-        # Remove completed animations
-        for animation in completed_animations:
-            self.animations.remove(animation)
+            if not animation.is_complete:
+                survivors.append(animation)
+        self.animations = survivors
     
     def stop_all(self):
         """Stop all running animations."""
@@ -110,6 +141,9 @@ class Animation:
         self.on_update = on_update
         self.on_complete = on_complete
         self.animation_type = animation_type
+        # Maps raw progress (0.0 to 1.0) to eased progress; resolved here so
+        # update() does not dispatch on the type every frame
+        self._ease = _EASING_FUNCTIONS.get(animation_type, _ease_linear)
         self.elapsed = 0.0
         self.is_running = True
         self.is_complete = False
@@ -143,29 +177,6 @@ class Animation:
         if self.is_complete and self.on_complete:
             self.on_complete()
     
-    def _ease(self, t: float) -> float:
-        """
-        Apply easing function to normalize progress.
-        
-        Args:
-            t: Raw progress value (0.0 to 1.0)
-        
-        Returns:
-            Eased progress value
-        """
-        if self.animation_type == AnimationType.LINEAR:
-            return t
-        elif self.animation_type == AnimationType.EASE_IN:
-            return t * t
-        elif self.animation_type == AnimationType.EASE_OUT:
-            return t * (2 - t)
-        elif self.animation_type == AnimationType.EASE_IN_OUT:
-            if t < 0.5:
-                return 2 * t * t
-            else:
-                return 1 - pow(-2 * t + 2, 2) / 2
-        return t
-    
     def stop(self):
         """Stop the animation."""
         self.is_running = False
@@ -198,10 +209,12 @@ class TransitionAnimation:
         Returns:
             Animation object
         """
+        # The deltas are fixed, so each frame is just a multiply-add per axis
+        dx = end_x - start_x
+        dy = end_y - start_y
+        
         def update(progress: float):
-            x = start_x + (end_x - start_x) * progress
-            y = start_y + (end_y - start_y) * progress
-            on_position_update(x, y)
+            on_position_update(start_x + dx * progress, start_y + dy * progress)
         
         anim = Animation(
             duration=duration,
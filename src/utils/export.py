@@ -33,32 +33,34 @@ class TreeExporter:
             True if export was successful, False otherwise
         """
         try:
-            from PyQt5.QtCore import QSize, Qt
-            from PyQt5.QtGui import QPixmap, QPainter
-            from PyQt5.QtWidgets import QApplication
+            from PyQt5.QtCore import Qt
+            from PyQt5.QtGui import QImage, QPainter
+            from PyQt5.QtWidgets import QGraphicsView
             
-            # Get canvas scene and rect
-            scene = canvas.scene()
+            # Get canvas scene and rect; TreeCanvas shadows scene() with an
+            # attribute, so call the QGraphicsView method directly
+            scene = QGraphicsView.scene(canvas)
             if not scene:
                 return False
             
             scene_rect = scene.itemsBoundingRect()
+            width = int(scene_rect.width() * scale)
+            height = int(scene_rect.height() * scale)
+            if width <= 0 or height <= 0:
+                return False
             
-            # Create pixmap with scale
-            size = QSize(
-                int(scene_rect.width() * scale),
-                int(scene_rect.height() * scale)
-            )
-            pixmap = QPixmap(size)
-            pixmap.fill(Qt.white)
+            # Render into a QImage rather than a QPixmap: it is not bound by
+            # the window system's pixmap limits and saves without a copy
+            image = QImage(width, height, QImage.Format_ARGB32_Premultiplied)
+            image.fill(Qt.white)
             
-            # Render scene to pixmap
-            painter = QPainter(pixmap)
+            # Render scene to image
+            painter = QPainter(image)
             scene.render(painter, source=scene_rect)
             painter.end()
             
             # Save to file
-            success = pixmap.save(file_path, format=format.upper())
+            success = image.save(file_path, format.upper())
             
             if success:
                 self.last_export_path = file_path
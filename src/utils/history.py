@@ -1,16 +1,124 @@
 """Undo/Redo history management for BST operations."""
-from typing import List, Any, Callable
+from typing import List, Any, Callable, Deque
+from collections import deque
 from dataclasses import dataclass
-from copy import deepcopy
 
 
 @dataclass
 class Operation:
-    """Represents a single operation that can be undone/redone."""
+    """
+    Represents a single operation that can be undone/redone.
+    
+    undo_action and redo_action should be closures over the inverse
+    operations (e.g. delete/insert of a value), not over copies of the
+    tree. data is kept for every entry in the history, so store plain
+    values in it; never a deep copy of the tree.
+    """
     name: str
     undo_action: Callable
     redo_action: Callable
     data: Any = None
+    
+    def undo(self, target: Any = None):
+        """Run the undo action (the target is not needed by closures)."""
+        self.undo_action()
+    
+    def redo(self, target: Any = None):
+        """Run the redo action (the target is not needed by closures)."""
+        self.redo_action()
+
+
+class TreeOp:
+    """
+    A tree operation recorded as plain data rather than a pair of closures.
+    
+    Undo and redo are applied to a target exposing the tree being edited
+    as ``target.tree`` and a ``target.restore_tree_state(snapshot)`` method
+    (the main window).
+    
+    Kinds:
+        INSERT: value was inserted; undone by deleting it again
+        DELETE: value was deleted; subtree is the pre-order of the subtree
+            it was removed from, which undo rebuilds
+        CLEAR, BULK: before/after are full tree snapshots; value is the
+            node count for BULK
+    """
+    
+    INSERT = "insert"
+    DELETE = "delete"
+    CLEAR = "clear"
+    BULK = "bulk"
+    
+    __slots__ = ('kind', 'value', 'subtree', 'before', 'after')
+    
+    def __init__(self, kind: str, value: Any = None, subtree: List[int] = None,
+                 before: Any = None, after: Any = None):
+        """
+        Initialize a tree operation.
+        
+        Args:
+            kind: One of INSERT, DELETE, CLEAR, BULK
+            value: Inserted/deleted value, or node count for BULK
+            subtree: Pre-order of the deleted node's subtree (DELETE only)
+            before: Snapshot before the operation (CLEAR/BULK only)
+            after: Snapshot after the operation (CLEAR/BULK only)
+        """
+        self.kind = kind
+        self.value = value
+        self.subtree = subtree
+        self.before = before
+        self.after = after
+    
+    @property
+    def name(self) -> str:
+        """Human readable description of the operation."""
+        if self.kind == self.INSERT:
+            return f"Insert {self.value}"
+        if self.kind == self.DELETE:
+            return f"Delete {self.value}"
+        if self.kind == self.CLEAR:
+            return "Clear tree"
+        return f"Generate random tree ({self.value} nodes)"
+    
+    def undo(self, target: Any):
+        """
+        Revert the operation.
+        
+        Args:
+            target: Object owning the tree (see class docstring)
+        """
+        kind = self.kind
+        if kind == self.INSERT:
+            # A new value always lands on a leaf, so deleting it again
+            # restores the previous shape exactly
+            target.tree.delete(self.value)
+        elif kind == self.DELETE:
+            # Removing what is left of the subtree touches nothing outside
+            # it; re-inserting its original pre-order then rebuilds it
+            tree = target.tree
+            value = self.value
+            for subtree_value in reversed(self.subtree):
+                if subtree_value != value:
+                    tree.delete(subtree_value)
+            for subtree_value in self.subtree:
+                tree.insert(subtree_value)
+        else:
+            target.restore_tree_state(self.before)
+    
+    def redo(self, target: Any):
+        """
+        Apply the operation again.
+        
+        Args:
+            target: Object owning the tree (see class docstring)
+        """
+        kind = self.kind
+        if kind == self.INSERT:
+            target.tree.insert(self.value)
+        elif kind == self.DELETE:
+            target.tree.delete(self.value)
+        else:
+            target.restore_tree_state(self.after)
 
 
 class OperationHistory:
@@ -19,31 +127,30 @@ class OperationHistory:
     Uses a command pattern to store and replay operations.
     """
     
-    def __init__(self, max_size: int = 50):
+    def __init__(self, max_size: int = 50, target: Any = None):
         """
         Initialize the operation history.
         
         Args:
             max_size: Maximum number of operations to keep in history
+            target: Object passed to each operation's undo()/redo()
         """
         self.max_size = max_size
-        self.undo_stack: List[Operation] = []
-        self.redo_stack: List[Operation] = []
+        self.target = target
+        # A full undo stack drops its oldest entry on append
+        self.undo_stack: Deque[Any] = deque(maxlen=max_size)
+        self.redo_stack: Deque[Any] = deque()
     
-    def record_operation(self, operation: Operation):
+    def record_operation(self, operation):
         """
         Record a new operation.
         Clears the redo stack when a new operation is performed.
         
         Args:
-            operation: Operation to record
+            operation: Operation or TreeOp to record
         """
         self.undo_stack.append(operation)
         self.redo_stack.clear()
-        
-        # Maintain max history size
-        if len(self.undo_stack) > self.max_size:
-            self.undo_stack.pop(0)
     
     def undo(self) -> bool:
         """
@@ -56,16 +163,10 @@ class OperationHistory:
             return False
         
         operation = self.undo_stack.pop()
-        operation.undo_action()
+        operation.undo(self.target)
         
-        # Create a reverse operation for redo
-        redo_op = Operation(
-            name=operation.name,
-            undo_action=operation.redo_action,
-            redo_action=operation.undo_action,
-            data=operation.data
-        )
-        self.redo_stack.append(redo_op)
+        # Kept as-is: redo() runs its redo_action, a later undo its undo_action
+        self.redo_stack.append(operation)
         return True
     
     def redo(self) -> bool:
@@ -79,7 +180,7 @@ class OperationHistory:
             return False
         
         operation = self.redo_stack.pop()
-        operation.redo_action()
+        operation.redo(self.target)
         self.undo_stack.append(operation)
         return True
     
@@ -1,28 +1,42 @@
 """
-Unit tests for BST Visualizer components.
-Run with: python tests.py
+Unit tests and benchmarks for BST Visualizer components.
+Run with: pytest (or python tests.py)
 """
 
+import math
+import random
 import sys
+from itertools import zip_longest
+from types import MappingProxyType, SimpleNamespace
+from unittest.mock import Mock, call
 sys.path.insert(0, '.')
 
+import pytest
+
 from src.models import BinarySearchTree, Node
+from src.utils import OperationHistory, TreeOp, AnimationEngine, AnimationType
+
+
+# Traversal orders of the classic_bst fixture (50, 30, 70, 20, 40, 60, 80)
+EXPECTED_ORDERS = MappingProxyType({
+    "in": (20, 30, 40, 50, 60, 70, 80),
+    "pre": (50, 30, 20, 40, 70, 60, 80),
+    "post": (20, 40, 30, 60, 80, 70, 50),
+    "level": (50, 30, 70, 20, 40, 60, 80),
+})
 
 
 def test_node_creation():
     """Test node creation and properties."""
-    print("Testing Node Creation...", end=" ")
     node = Node(50)
     assert node.value == 50
     assert node.left is None
     assert node.right is None
     assert node.is_leaf()
-    print("✓")
 
 
 def test_bst_insert():
     """Test BST insertion."""
-    print("Testing BST Insert...", end=" ")
     bst = BinarySearchTree()
     assert bst.insert(50)
     assert bst.insert(30)
@@ -30,12 +44,17 @@ def test_bst_insert():
     assert bst.insert(20)
     assert not bst.insert(50)  # Duplicate
     assert bst.get_size() == 4
-    print("✓")
+    
+    # Bulk insert matches one-by-one insertion
+    bulk = BinarySearchTree()
+    assert bulk.extend([50, 30, 70, 20, 50, 30]) == 4
+    assert bulk.get_size() == 4
+    assert bulk.preorder_traversal() == bst.preorder_traversal()
+    assert bulk.get_height() == 2
 
 
 def test_bst_search():
     """Test BST search."""
-    print("Testing BST Search...", end=" ")
     bst = BinarySearchTree()
     bst.insert(50)
     bst.insert(30)
@@ -44,12 +63,10 @@ def test_bst_search():
     assert bst.search(50) is not None
     assert bst.search(30) is not None
     assert bst.search(99) is None
-    print("✓")
 
 
 def test_bst_delete_leaf():
     """Test deleting a leaf node."""
-    print("Testing Delete Leaf...", end=" ")
     bst = BinarySearchTree()
     for val in [50, 30, 70, 20, 40]:
         bst.insert(val)
@@ -57,12 +74,10 @@ def test_bst_delete_leaf():
     assert bst.delete(20)
     assert bst.search(20) is None
     assert bst.get_size() == 4
-    print("✓")
 
 
 def test_bst_delete_one_child():
     """Test deleting a node with one child."""
-    print("Testing Delete One Child...", end=" ")
     bst = BinarySearchTree()
     for val in [50, 30, 70, 20]:
         bst.insert(val)
@@ -70,77 +85,92 @@ def test_bst_delete_one_child():
     assert bst.delete(30)
     assert bst.search(30) is None
     assert bst.search(20) is not None
-    print("✓")
 
 
-def test_bst_delete_two_children():
+def test_bst_delete_two_children(fresh_bst):
     """Test deleting a node with two children."""
-    print("Testing Delete Two Children...", end=" ")
-    bst = BinarySearchTree()
-    for val in [50, 30, 70, 20, 40, 60, 80]:
-        bst.insert(val)
-    
+    bst = fresh_bst
     assert bst.delete(30)
     assert bst.search(30) is None
     # Confirm tree structure is maintained
     result = bst.inorder_traversal()
     assert result == [20, 40, 50, 60, 70, 80]
-    print("✓")
 
 
-def test_bst_inorder():
+def test_bst_inorder(classic_bst):
     """Test inorder traversal."""
-    print("Testing Inorder Traversal...", end=" ")
-    bst = BinarySearchTree()
-    for val in [50, 30, 70, 20, 40, 60, 80]:
-        bst.insert(val)
-    
-    result = bst.inorder_traversal()
-    assert result == [20, 30, 40, 50, 60, 70, 80]
-    print("✓")
+    assert tuple(classic_bst.inorder_traversal()) == EXPECTED_ORDERS["in"]
 
 
-def test_bst_preorder():
+def test_bst_preorder(classic_bst):
     """Test preorder traversal."""
-    print("Testing Preorder Traversal...", end=" ")
-    bst = BinarySearchTree()
-    bst.insert(50)
-    bst.insert(30)
-    bst.insert(70)
+    result = classic_bst.preorder_traversal()
+    assert tuple(result) == EXPECTED_ORDERS["pre"]
     
-    result = bst.preorder_traversal()
-    assert result == [50, 30, 70]
-    print("✓")
+    out = [0] * classic_bst.get_size()
+    classic_bst.preorder_iter_into(out)
+    assert out == result
 
 
-def test_bst_postorder():
-    """Test postorder traversal."""
-    print("Testing Postorder Traversal...", end=" ")
+def test_subtree_undo():
+    """Test that a delete can be undone from its subtree's pre-order."""
     bst = BinarySearchTree()
-    bst.insert(50)
-    bst.insert(30)
-    bst.insert(70)
+    for val in [50, 30, 70, 20, 40, 35, 45, 60]:
+        bst.insert(val)
+    before = bst.preorder_traversal()
+    subtree = bst.get_subtree_preorder(30)
+    assert subtree == [30, 20, 40, 35, 45]
+    assert bst.get_subtree_preorder(99) == []
+    
+    # Undo "Delete 30" the way MainWindow's history does
+    history = OperationHistory(target=SimpleNamespace(tree=bst))
+    assert bst.delete(30)
+    history.record_operation(TreeOp(TreeOp.DELETE, 30, subtree=subtree))
+    after = bst.preorder_traversal()
+    assert history.undo()
+    assert bst.preorder_traversal() == before
+    assert history.redo()
+    assert bst.preorder_traversal() == after
     
-    result = bst.postorder_traversal()
-    assert result == [30, 70, 50]
-    print("✓")
+    assert bst.insert(33)
+    history.record_operation(TreeOp(TreeOp.INSERT, 33))
+    assert history.get_undo_description() == "Undo Insert 33"
+    assert history.undo() and bst.preorder_traversal() == after
 
 
-def test_bst_levelorder():
+def test_bst_postorder(classic_bst):
+    """Test postorder traversal."""
+    assert tuple(classic_bst.postorder_traversal()) == EXPECTED_ORDERS["post"]
+
+
+def test_bst_levelorder(classic_bst):
     """Test level-order traversal."""
-    print("Testing Level-order Traversal...", end=" ")
-    bst = BinarySearchTree()
-    for val in [50, 30, 70, 20, 40, 60, 80]:
-        bst.insert(val)
+    assert tuple(classic_bst.levelorder_traversal()) == EXPECTED_ORDERS["level"]
+
+
+def _iter_equals(iterable, expected) -> bool:
+    """Compare an iterator with a sequence lazily, stopping at the first mismatch."""
+    missing = object()
+    return all(a == b for a, b in zip_longest(iterable, expected, fillvalue=missing))
+
+
+@pytest.mark.parametrize("order", ["in", "pre", "post", "level"])
+def test_traversal_iterators(classic_bst, order):
+    """Test that the lazy traversals yield the same values as the list versions."""
+    iterate = getattr(classic_bst, f"{order}order_iter")
+    assert _iter_equals(iterate(), EXPECTED_ORDERS[order])
+    assert not _iter_equals(iterate(), EXPECTED_ORDERS[order][:-1])
+    assert _iter_equals(BinarySearchTree().inorder_iter(), ())
     
-    result = bst.levelorder_traversal()
-    assert result == [50, 30, 70, 20, 40, 60, 80]
-    print("✓")
+    # Deep trees are walked without recursion
+    chain = BinarySearchTree()
+    chain.extend(range(sys.getrecursionlimit() + 500))
+    traversal = getattr(chain, f"{order}order_traversal")
+    assert _iter_equals(getattr(chain, f"{order}order_iter")(), traversal())
 
 
 def test_bst_height():
     """Test height calculation."""
-    print("Testing Height Calculation...", end=" ")
     bst = BinarySearchTree()
     assert bst.get_height() == -1  # Empty tree
     
@@ -153,38 +183,189 @@ def test_bst_height():
     
     bst.insert(20)
     assert bst.get_height() == 2
-    print("✓")
 
 
-def test_bst_balanced():
+def test_bst_balanced(classic_bst):
     """Test balanced tree check."""
-    print("Testing Balance Check...", end=" ")
     
     # Balanced tree
-    bst = BinarySearchTree()
-    for val in [50, 30, 70, 20, 40, 60, 80]:
-        bst.insert(val)
-    assert bst.is_balanced()
+    assert classic_bst.is_balanced()
     
     # Unbalanced tree (linked list)
     bst2 = BinarySearchTree()
     for val in [10, 20, 30, 40, 50]:
         bst2.insert(val)
     assert not bst2.is_balanced()
-    print("✓")
+    
+    # The same input is rotated back into shape when self-balancing
+    avl = BinarySearchTree(self_balancing=True)
+    for val in [10, 20, 30, 40, 50]:
+        avl.insert(val)
+    assert avl.is_balanced()
+    assert avl.get_height() == 2
+
+
+@pytest.mark.parametrize("seq,expected_height", [
+    ([30, 20, 10], 1),  # LL: single right rotation
+    ([10, 20, 30], 1),  # RR: single left rotation
+    ([30, 10, 20], 1),  # LR: left rotation of the child, then right
+    ([10, 30, 20], 1),  # RL: right rotation of the child, then left
+])
+def test_avl_insert_rotations(seq, expected_height):
+    """Test that each insert rotation case ends with the middle value at the root."""
+    bst = BinarySearchTree(self_balancing=True)
+    for val in seq:
+        bst.insert(val)
+    assert bst.is_balanced()
+    assert bst.get_height() == expected_height
+    assert bst.levelorder_traversal() == [20, 10, 30]
+
+
+@pytest.mark.parametrize("seq,removed,expected_levelorder", [
+    ([20, 30, 10, 5], 30, [10, 5, 20]),    # LL
+    ([20, 10, 30, 40], 10, [30, 20, 40]),  # RR
+    ([20, 30, 10, 15], 30, [15, 10, 20]),  # LR
+    ([20, 10, 30, 25], 10, [25, 20, 30]),  # RL
+])
+def test_avl_delete_rotations(seq, removed, expected_levelorder):
+    """Test that deleting from the short side rebalances with each rotation case."""
+    bst = BinarySearchTree(self_balancing=True)
+    for val in seq:
+        bst.insert(val)
+    assert bst.get_height() == 2
+    
+    assert bst.delete(removed)
+    assert bst.is_balanced()
+    assert bst.get_height() == 1
+    assert bst.levelorder_traversal() == expected_levelorder
+
+
+@pytest.mark.parametrize("seq,max_rotations", [
+    (list(range(1, 17)), 11),   # Ascending: one left rotation per overflow
+    (list(range(16, 0, -1)), 11),  # Descending: one right rotation per overflow
+    ([30, 10, 20], 2),  # LR: the double rotation counts twice
+])
+def test_avl_rotation_count(seq, max_rotations):
+    """Test that worst-case inserts stay within a fixed number of rotations."""
+    bst = BinarySearchTree(self_balancing=True)
+    for val in seq:
+        bst.insert(val)
+    assert bst._rotation_count <= max_rotations
+    assert bst.get_height() == math.floor(math.log2(len(seq)))
+    
+    # Plain trees never rotate
+    plain = BinarySearchTree()
+    plain.extend(seq)
+    assert plain._rotation_count == 0
+
+
+def test_self_balancing():
+    """Test AVL rebalancing on insert and delete."""
+    # Sorted input stays logarithmic instead of becoming a linked list
+    bst = BinarySearchTree(self_balancing=True)
+    for val in range(1, 128):
+        bst.insert(val)
+    assert bst.get_height() == 6
+    assert bst.is_balanced()
+    
+    # Deleting one side forces a rotation on the way back up
+    for val in range(1, 64):
+        assert bst.delete(val)
+    assert bst.is_balanced()
+    assert bst.get_height() == 6
+    assert bst.inorder_traversal() == list(range(64, 128))
+
+
+def test_layout():
+    """Test cached node layout coordinates."""
+    bst = BinarySearchTree()
+    for val in [50, 30, 70, 20]:
+        bst.insert(val)
+    
+    assert bst.layout()
+    assert (bst.root.x, bst.root.y) == (0, 0)
+    node = bst.search(20)
+    assert node.x < bst.search(30).x < bst.root.x < bst.search(70).x
+    assert node.y > bst.search(30).y > bst.root.y
+    
+    # Cached until the structure changes
+    assert not bst.layout()
+    bst.insert(40)
+    assert bst.layout()
+
+
+def test_cached_stats():
+    """Test that cached height and balance follow every mutation."""
+    bst = BinarySearchTree()
+    for val in [50, 30, 70]:
+        bst.insert(val)
+    assert bst.get_height() == 1 and bst.is_balanced()
+    
+    bst.insert(20)
+    bst.insert(10)
+    assert bst.get_height() == 3 and not bst.is_balanced()
+    
+    bst.delete(10)
+    assert bst.get_height() == 2 and bst.is_balanced()
+    
+    bst.clear()
+    assert bst.get_height() == -1 and bst.is_balanced()
+    
+    # Min, max and leaf count are memoized per version
+    tree = BinarySearchTree()
+    assert tree.minimum() is None and tree.maximum() is None
+    assert tree.count_leaves() == 0
+    version = tree.version
+    for val in [50, 30, 70, 20, 40]:
+        tree.insert(val)
+    assert tree.version != version
+    version = tree.version
+    assert not tree.insert(50) and not tree.delete(99)
+    assert tree.version == version
+    assert (tree.minimum(), tree.maximum()) == (20, 70)
+    assert tree.count_leaves() == 3
+    tree.delete(20)
+    tree.insert(90)
+    assert (tree.minimum(), tree.maximum()) == (30, 90)
+    assert tree.count_leaves() == 2
+    tree.clear()
+    assert tree.minimum() is None and tree.count_leaves() == 0
+
+
+def test_pickle_snapshot():
+    """Test that a pickled tree restores with the same shape."""
+    import pickle
+    bst = BinarySearchTree()
+    bst.extend([50, 30, 70, 20, 40, 35, 80, 90])
+    bst.delete(50)
+    
+    restored = pickle.loads(pickle.dumps(bst))
+    assert restored.preorder_traversal() == bst.preorder_traversal()
+    assert restored.inorder_traversal() == bst.inorder_traversal()
+    assert restored.get_size() == 7 and restored.get_height() == 3
+    assert restored.search(35).parent.value == 40
+    assert restored.is_balanced() == bst.is_balanced()
+    assert restored.insert(45) and restored.delete(80)
+    assert restored.inorder_traversal() == [20, 30, 35, 40, 45, 70, 90]
+    
+    assert pickle.loads(pickle.dumps(BinarySearchTree())).is_empty()
+    
+    # Degenerate trees do not hit the recursion limit
+    depth = sys.getrecursionlimit() + 500
+    chain = BinarySearchTree()
+    chain.extend(range(depth))
+    assert pickle.loads(pickle.dumps(chain)).get_height() == depth - 1
 
 
 def test_operation_history():
     """Test undo/redo history."""
-    print("Testing Operation History...", end=" ")
     from src.utils import OperationHistory, Operation
     
     history = OperationHistory()
     
     # Create and record operations
-    def undo1(): pass
-    def redo1(): pass
-    
+    undo1 = Mock()
+    redo1 = Mock()
     op1 = Operation(name="Op1", undo_action=undo1, redo_action=redo1)
     history.record_operation(op1)
     
@@ -193,21 +374,61 @@ def test_operation_history():
     
     # Test undo
     assert history.undo()
+    undo1.assert_called_once_with()
+    assert redo1.call_count == 0
     assert not history.can_undo()
     assert history.can_redo()
     
     # Test redo
     assert history.redo()
+    redo1.assert_called_once_with()
+    assert undo1.call_count == 1
     assert history.can_undo()
     assert not history.can_redo()
-    print("✓")
+    
+    # Each direction runs its own action, however often it is repeated
+    assert history.undo() and history.redo() and history.undo()
+    assert undo1.call_count == 3
+    assert redo1.call_count == 2
+    
+    # Bulk operations restore whole snapshots through the target
+    target = Mock()
+    history = OperationHistory(target=target)
+    history.record_operation(TreeOp(TreeOp.CLEAR, before=[50, 30], after=[]))
+    assert history.undo() and history.redo()
+    assert target.restore_tree_state.mock_calls == [call([50, 30]), call([])]
+
+
+def test_operation_history_order():
+    """Test that undo runs operations newest first and redo oldest first."""
+    from src.utils import OperationHistory, Operation
+    
+    history = OperationHistory()
+    actions = Mock()
+    for i in range(1, 4):
+        history.record_operation(Operation(
+            name=f"Op{i}",
+            undo_action=getattr(actions, f"undo{i}"),
+            redo_action=getattr(actions, f"redo{i}")
+        ))
+    
+    assert history.undo() and history.undo()
+    assert history.redo()
+    assert history.undo() and history.undo()
+    assert not history.undo()
+    assert history.redo() and history.redo() and history.redo()
+    assert not history.redo()
+    
+    assert actions.mock_calls == [
+        call.undo3(), call.undo2(),
+        call.redo2(),
+        call.undo2(), call.undo1(),
+        call.redo1(), call.redo2(), call.redo3(),
+    ]
 
 
 def test_animation():
     """Test animation engine."""
-    print("Testing Animation Engine...", end=" ")
-    from src.utils import AnimationEngine, AnimationType
-    
     engine = AnimationEngine()
     progress_values = []
     
@@ -223,21 +444,16 @@ def test_animation():
     # Simulate updates
     engine.update(50)  # 50ms
     assert len(progress_values) > 0
-    assert progress_values[-1] == 0.5
+    assert math.isclose(progress_values[-1], 0.5, abs_tol=1e-9)
     
     engine.update(50)  # 100ms total
     assert progress_values[-1] >= 0.99
     assert anim.is_complete
-    print("✓")
 
 
-def test_tree_properties():
+def test_tree_properties(fresh_bst):
     """Test various tree properties."""
-    print("Testing Tree Properties...", end=" ")
-    bst = BinarySearchTree()
-    for val in [50, 30, 70, 20, 40, 60, 80]:
-        bst.insert(val)
-    
+    bst = fresh_bst
     assert bst.get_size() == 7
     assert not bst.is_empty()
     assert bst.get_height() == 2
@@ -245,12 +461,10 @@ def test_tree_properties():
     bst.clear()
     assert bst.is_empty()
     assert bst.get_size() == 0
-    print("✓")
 
 
 def test_edge_cases():
     """Test edge cases."""
-    print("Testing Edge Cases...", end=" ")
     
     # Single node tree
     bst = BinarySearchTree()
@@ -263,60 +477,244 @@ def test_edge_cases():
     bst2.insert(50)
     assert not bst2.delete(99)
     
-    # Large tree
+    # Sorted input degenerates into a linked list
+    chain = BinarySearchTree()
+    for i in range(1, 11):
+        chain.insert(i)
+    assert chain.get_height() == 9
+    assert not chain.is_balanced()
+    
+    # Large tree from shuffled input
+    rng = random.Random(0xBEEF)
+    keys = rng.sample(range(1, 100_001), 10_000)
     bst3 = BinarySearchTree()
-    for i in range(1, 101):
-        bst3.insert(i)
-    assert bst3.get_size() == 100
-    print("✓")
-
-
-def run_all_tests():
-    """Run all unit tests."""
-    print("\n" + "="*50)
-    print("BST Visualizer - Unit Tests")
-    print("="*50 + "\n")
-    
-    tests = [
-        test_node_creation,
-        test_bst_insert,
-        test_bst_search,
-        test_bst_delete_leaf,
-        test_bst_delete_one_child,
-        test_bst_delete_two_children,
-        test_bst_inorder,
-        test_bst_preorder,
-        test_bst_postorder,
-        test_bst_levelorder,
-        test_bst_height,
-        test_bst_balanced,
-        test_operation_history,
-        test_animation,
-        test_tree_properties,
-        test_edge_cases,
-    ]
+    for key in keys:
+        bst3.insert(key)
+    assert bst3.get_size() == 10_000
+    assert bst3.inorder_traversal() == sorted(keys)
+    
+    # Random mix of operations, checked against a plain set
+    present = set(keys)
+    for _ in range(20_000):
+        key = rng.randint(1, 100_000)
+        roll = rng.random()
+        if roll < 0.4:
+            assert bst3.insert(key) == (key not in present)
+            present.add(key)
+        elif roll < 0.7:
+            assert bst3.delete(key) == (key in present)
+            present.discard(key)
+        else:
+            assert (bst3.search(key) is not None) == (key in present)
+    assert bst3.get_size() == len(present)
+    assert bst3.inorder_traversal() == sorted(present)
+
+
+def test_deep_tree():
+    """Test operations on a degenerate tree deeper than the recursion limit."""
+    bst = BinarySearchTree()
+    depth = sys.getrecursionlimit() + 500
+    for i in range(depth):
+        bst.insert(i)
+    
+    assert bst.get_height() == depth - 1
+    assert not bst.is_balanced()
+    assert bst.search(depth - 1) is not None
+    assert bst.inorder_traversal() == list(range(depth))
+    assert bst.postorder_traversal()[-1] == 0
+    assert bst.delete(depth // 2)
+    assert bst.get_size() == depth - 1
+
+
+def test_control_panel_value_input(qapp):
+    """Test value parsing in the control panel, including grouped numbers."""
+    from src.ui.widgets.control_panel import ControlPanel
+    
+    panel = ControlPanel()
+    inserted = Mock()
+    panel.insert_requested.connect(inserted)
+    
+    # The validator accepts group separators, which int() would reject
+    panel.insert_input.setText("1,000")
+    panel._on_insert_clicked()
+    panel.insert_input.setText("50")
+    panel._on_insert_clicked()
+    assert inserted.call_args_list == [call(1000), call(50)]
+    assert panel.insert_input.text() == ""
+    
+    # Out of range input is flagged and not emitted
+    panel.insert_input.setText("99999")
+    panel._on_insert_clicked()
+    assert inserted.call_count == 2
+    assert panel.insert_input.property("invalid")
+
+
+# Benchmarks below are marked perf, which pytest.ini deselects by default;
+# run them with: pytest -m perf
+# Tree sizes the benchmarks below are run at
+BENCHMARK_SIZES = [100, 1000, 10000]
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="insert")
+@pytest.mark.parametrize("n", BENCHMARK_SIZES)
+def test_benchmark_insert(benchmark, random_values, n):
+    """Benchmark inserting n random values into an empty tree."""
+    values = random_values(n)
+    
+    def insert_all(bst):
+        for val in values:
+            bst.insert(val)
+        return bst
+    
+    bst = benchmark.pedantic(
+        insert_all, setup=lambda: ((BinarySearchTree(),), {}), rounds=5
+    )
+    assert bst.get_size() == n
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="insert-size")
+@pytest.mark.parametrize("n", [1_000, 10_000, 100_000])
+def test_benchmark_insert_with_size(benchmark, random_values, n):
+    """Benchmark inserting n values while reading the size after each one."""
+    values = random_values(n)
+    
+    def insert_all(bst):
+        return [bst.insert(val) and bst.get_size() for val in values]
+    
+    sizes = benchmark.pedantic(
+        insert_all, setup=lambda: ((BinarySearchTree(),), {}), rounds=5
+    )
+    assert sizes == list(range(1, n + 1))
+
+
+def test_get_size_counted(random_values):
+    """get_size() must read a counter kept by insert and delete, not walk the tree."""
+    values = random_values(1000)
+    bst = BinarySearchTree()
+    for i, val in enumerate(values, 1):
+        assert bst.insert(val)
+        assert bst.get_size() == i
+    assert not bst.insert(values[0])
+    assert bst.get_size() == 1000
+    
+    for i, val in enumerate(values[:500], 1):
+        assert bst.delete(val)
+        assert bst.get_size() == 1000 - i
+    assert not bst.delete(values[0])
+    
+    # With its nodes unlinked the tree still reports the counted size,
+    # so the answer cannot come from a walk
+    bst.root = None
+    assert bst.get_size() == 500
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="insert")
+@pytest.mark.parametrize("n", BENCHMARK_SIZES)
+def test_benchmark_avl_insert_sorted(benchmark, n):
+    """Benchmark inserting 1..n in order, the worst case for rotations."""
+    def insert_all(bst):
+        for val in range(1, n + 1):
+            bst.insert(val)
+        return bst
+    
+    bst = benchmark.pedantic(
+        insert_all, setup=lambda: ((BinarySearchTree(self_balancing=True),), {}),
+        rounds=5
+    )
+    assert bst.get_height() == math.floor(math.log2(n))
+    # Every insert after the first full level rotates at most once
+    assert bst._rotation_count < n
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="search")
+@pytest.mark.parametrize("n", BENCHMARK_SIZES)
+def test_benchmark_search(benchmark, random_values, n):
+    """Benchmark searching for every value of an n-node tree."""
+    values = random_values(n)
+    bst = BinarySearchTree()
+    bst.extend(values)
+    
+    def search_all():
+        return sum(1 for val in values if bst.search(val) is not None)
+    
+    assert benchmark(search_all) == n
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="delete")
+@pytest.mark.parametrize("n", BENCHMARK_SIZES)
+def test_benchmark_delete(benchmark, random_values, n):
+    """Benchmark deleting every value of an n-node tree."""
+    values = random_values(n)
+    
+    def build():
+        bst = BinarySearchTree()
+        bst.extend(values)
+        return (bst,), {}
     
-    passed = 0
-    failed = 0
+    def delete_all(bst):
+        for val in values:
+            bst.delete(val)
+        return bst
     
-    for test in tests:
-        try:
-            test()
-            passed += 1
-        except AssertionError as e:
-            print(f"✗ FAILED: {e}")
-            failed += 1
-        except Exception as e:
-            print(f"✗ ERROR: {e}")
-            failed += 1
+    bst = benchmark.pedantic(delete_all, setup=build, rounds=5)
+    assert bst.is_empty()
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="traversal")
+@pytest.mark.parametrize("order", ["inorder", "preorder", "postorder", "levelorder"])
+@pytest.mark.parametrize("n", BENCHMARK_SIZES)
+def test_benchmark_traversal(benchmark, random_values, n, order):
+    """Benchmark each traversal of an n-node tree."""
+    bst = BinarySearchTree()
+    bst.extend(random_values(n))
     
-    print("\n" + "="*50)
-    print(f"Results: {passed} passed, {failed} failed")
-    print("="*50 + "\n")
+    result = benchmark(getattr(bst, f"{order}_traversal"))
+    assert len(result) == n
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="traversal")
+@pytest.mark.parametrize("order", ["inorder", "preorder", "postorder", "levelorder"])
+@pytest.mark.parametrize("n", BENCHMARK_SIZES)
+def test_benchmark_traversal_iter(benchmark, random_values, n, order):
+    """Benchmark draining each lazy traversal of an n-node tree into a list."""
+    bst = BinarySearchTree()
+    bst.extend(random_values(n))
+    iterate = getattr(bst, f"{order}_iter")
+    
+    result = benchmark(lambda: list(iterate()))
+    assert len(result) == n
+
+
+# Time available for one frame at 60 FPS, in seconds
+FRAME_BUDGET = 1 / 60
+
+
+@pytest.mark.perf
+@pytest.mark.benchmark(group="animation")
+@pytest.mark.parametrize("animation_type", list(AnimationType))
+def test_benchmark_animation_frame(benchmark, animation_type):
+    """Benchmark one engine frame with 100 running animations."""
+    engine = AnimationEngine()
+    for _ in range(100):
+        engine.create_animation(
+            duration=1e12,
+            on_update=lambda progress: None,
+            animation_type=animation_type
+        )
     
-    return failed == 0
+    benchmark(engine.update, 1)
+    assert len(engine.animations) == 100
+    # Timing is unavailable when benchmarks are disabled
+    if benchmark.stats is not None:
+        assert benchmark.stats.stats.mean < FRAME_BUDGET
 
 
 if __name__ == "__main__":
-    success = run_all_tests()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, "-q"]))